@@ -0,0 +1,76 @@
+# Day 44 - One-Pass Order Aggregation
+# Every metric from analytics_exercise.py in a single walk over the orders
+
+class OrderAggregator:
+    """
+    Aggregates e-commerce orders in one pass
+    Works on any iterable of order dicts (list, generator, file reader),
+    so the orders never need to be in memory at the same time
+    """
+
+    def __init__(self):
+        self.total_orders = 0
+        self.cancelled_orders = 0
+        self.delivered_orders = 0
+        self.delivered_revenue = 0
+        self.customers = {}          # customer -> orders / revenue / delivered_orders
+        self._first_delivered = {}   # customer -> rank of their first delivered order
+
+    def add(self, order):
+        """Fold a single order dict (customer, amount, status) into the totals"""
+        customer = order["customer"]
+        stats = self.customers.get(customer)
+        if stats is None:
+            stats = {"orders": 0, "revenue": 0, "delivered_orders": 0}
+            self.customers[customer] = stats
+
+        self.total_orders += 1
+        stats["orders"] += 1
+
+        status = order["status"]
+        if status == "Delivered":
+            amount = order["amount"]
+            self.delivered_orders += 1
+            self.delivered_revenue += amount
+            stats["revenue"] += amount
+            stats["delivered_orders"] += 1
+            if customer not in self._first_delivered:
+                self._first_delivered[customer] = len(self._first_delivered)
+        elif status == "Cancelled":
+            self.cancelled_orders += 1
+
+    def consume(self, orders):
+        """Fold an iterable of orders and return self (for chaining)"""
+        for order in orders:
+            self.add(order)
+        return self
+
+    def cancellation_rate(self):
+        """Cancelled orders as a percentage of all orders"""
+        return (self.cancelled_orders / self.total_orders) * 100
+
+    def top_customer(self):
+        """
+        (customer, delivered spend) for the highest-spending customer
+        Ties go to the customer whose first delivered order came first
+        """
+        customer = max(
+            self._first_delivered,
+            key=lambda c: (self.customers[c]["revenue"], -self._first_delivered[c]),
+        )
+        return customer, self.customers[customer]["revenue"]
+
+    def average_order_value(self):
+        """Average delivered order value"""
+        return self.delivered_revenue / self.delivered_orders
+
+    def customer_summary(self):
+        """Per-customer stats with avg_order (delivered revenue / delivered orders)"""
+        summary = {}
+        for customer, stats in self.customers.items():
+            delivered = stats["delivered_orders"]
+            summary[customer] = {
+                **stats,
+                "avg_order": stats["revenue"] / delivered if delivered > 0 else 0,
+            }
+        return summary
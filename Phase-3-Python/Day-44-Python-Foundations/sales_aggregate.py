@@ -0,0 +1,89 @@
+# Day 44 - Running Aggregates for SalesAnalyzer
+# Keep totals up to date as transactions arrive
+
+import heapq
+
+
+class SalesAggregate:
+    """
+    Running totals for a stream of sales transactions
+    total, count and per-product revenue are updated on every add,
+    so reading them back never rescans the data
+    """
+
+    def __init__(self):
+        self.total = 0
+        self.count = 0
+        self.product_revenue = {}   # product -> revenue, in first-seen order
+        self._first_seen = {}       # product -> position it first appeared
+        self._heap = []             # (-revenue, first_seen, product), may hold stale entries
+
+    def add(self, product, revenue):
+        """Fold a single transaction into the totals"""
+        self.total += revenue
+        self.count += 1
+        self._bump(product, revenue)
+
+    def add_batch(self, product_totals, total, count):
+        """
+        Fold a pre-aggregated batch into the totals
+        product_totals: dict of product -> revenue, in first-seen order
+        """
+        self.total += total
+        self.count += count
+        for product, revenue in product_totals.items():
+            self._bump(product, revenue)
+
+    def merge(self, other):
+        """
+        Fold another SalesAggregate (e.g. from a different shard) into this one
+        Merging shards in input order gives the same totals and top product
+        as aggregating the concatenated data in one pass
+        """
+        self.add_batch(other.product_revenue, other.total, other.count)
+        return self
+
+    def __getstate__(self):
+        # The heap is rebuilt after unpickling, no need to ship it between processes
+        state = self.__dict__.copy()
+        state['_heap'] = []
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._rebuild_heap()
+
+    def _bump(self, product, revenue):
+        """Add revenue to one product and record its new value in the heap"""
+        if product in self.product_revenue:
+            self.product_revenue[product] += revenue
+        else:
+            self.product_revenue[product] = revenue
+            self._first_seen[product] = len(self._first_seen)
+
+        heapq.heappush(self._heap, (-self.product_revenue[product], self._first_seen[product], product))
+        # Stale entries pile up on every update; rebuild before the heap outgrows the products
+        if len(self._heap) > 2 * len(self.product_revenue) + 64:
+            self._rebuild_heap()
+
+    def _rebuild_heap(self):
+        self._heap = [(-revenue, self._first_seen[product], product)
+                      for product, revenue in self.product_revenue.items()]
+        heapq.heapify(self._heap)
+
+    def top(self):
+        """
+        Product with the highest revenue as (product, revenue)
+        Ties go to the product seen first, like max() over the revenue dict
+        """
+        heap = self._heap
+        # Drop entries whose revenue is no longer the product's current value
+        while heap and -heap[0][0] != self.product_revenue[heap[0][2]]:
+            heapq.heappop(heap)
+        if not heap:
+            raise ValueError("No transactions to rank")
+        return heap[0][2], -heap[0][0]
+
+    def average(self):
+        """Average revenue per transaction"""
+        return self.total / self.count
@@ -1,50 +1,252 @@
 # Day 44 - OOP for Data Analysis
 # SalesAnalyzer Class
 
+import os
+import time
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from sales_aggregate import SalesAggregate
+from sales_columns import SalesColumns
+from sales_ingest import peak_rss_mb, read_csv_chunks, read_jsonl_chunks
+
+
+def _aggregate_shard(shard):
+    """Worker: aggregate one shard of transactions (runs in a child process)"""
+    return SalesAnalyzer(shard, backend="columnar", keep_rows=False).aggregate
+
+
+def _aggregate_file(path):
+    """Worker: stream one CSV / JSON-lines file and return its aggregate"""
+    if path.endswith(".jsonl"):
+        return SalesAnalyzer.from_jsonl(path, backend="columnar", keep_rows=False).aggregate
+    return SalesAnalyzer.from_csv(path, backend="columnar", keep_rows=False).aggregate
+
+
 class SalesAnalyzer:
     """
     A class to analyze sales data
     Demonstrates OOP concepts for data analytics
     """
     
-    def __init__(self, sales_data):
+    def __init__(self, sales_data=(), backend="list", keep_rows=True):
         """
         Initialize with sales data
         sales_data: list of dicts with keys: 'date', 'product', 'quantity', 'revenue'
+                    (or a SalesColumns object)
+        backend: "list" keeps the list of dicts, "columnar" stores NumPy arrays
+        keep_rows: False keeps only the running totals (bounded memory);
+                   the summary methods still work but filters do not
+        """
+        if backend not in ("list", "columnar"):
+            raise ValueError(f"Unknown backend: {backend!r} (use 'list' or 'columnar')")
+        if isinstance(sales_data, SalesColumns):
+            backend = "columnar"
+
+        self.backend = backend
+        self.keep_rows = keep_rows
+        self.data = SalesColumns.empty() if backend == "columnar" else []
+        self.ingest_stats = None
+        self.aggregate = SalesAggregate()
+        # Secondary indexes, built lazily on the first filter call
+        self._product_index = None
+        self._date_index = None
+        self.extend(sales_data)
+    
+    @classmethod
+    def from_csv(cls, path, chunk_size=100_000, backend="list", keep_rows=True):
+        """
+        Stream a CSV export (header: date, product, quantity, revenue) in chunks
+        Throughput and peak memory are recorded in `ingest_stats`
+        """
+        return cls._from_chunks(read_csv_chunks(path, chunk_size), backend, keep_rows)
+    
+    @classmethod
+    def from_jsonl(cls, path, chunk_size=100_000, backend="list", keep_rows=True):
         """
-        self.data = sales_data
+        Stream a JSON-lines export (one transaction object per line) in chunks
+        Throughput and peak memory are recorded in `ingest_stats`
+        """
+        return cls._from_chunks(read_jsonl_chunks(path, chunk_size), backend, keep_rows)
+    
+    @classmethod
+    def _from_chunks(cls, chunks, backend, keep_rows):
+        """Fold each chunk into a new analyzer, timing the whole ingest"""
+        analyzer = cls(backend=backend, keep_rows=keep_rows)
+        start = time.perf_counter()
+        for chunk in chunks:
+            analyzer.extend(chunk)
+        elapsed = time.perf_counter() - start
+
+        rows = analyzer.aggregate.count
+        analyzer.ingest_stats = {
+            "rows": rows,
+            "seconds": elapsed,
+            "rows_per_sec": rows / elapsed if elapsed > 0 else float('inf'),
+            "peak_rss_mb": peak_rss_mb(),
+        }
+        return analyzer
+    
+    @classmethod
+    def parallel(cls, sales_data, workers=None, shards=None):
+        """
+        Aggregate sales_data across a process pool (summary only, rows are not kept)
+        sales_data is split into contiguous shards; shard aggregates are merged in
+        order, so summary_report() matches the single-process result (exactly for
+        integer revenue, to rounding for float revenue)
+        """
+        workers = workers or os.cpu_count() or 1
+        shards = shards or workers * 4
+        n = len(sales_data)
+        bounds = [n * i // shards for i in range(shards + 1)]
+        if isinstance(sales_data, SalesColumns):
+            pieces = [sales_data.take(slice(lo, hi)) for lo, hi in zip(bounds, bounds[1:]) if hi > lo]
+        else:
+            pieces = [sales_data[lo:hi] for lo, hi in zip(bounds, bounds[1:]) if hi > lo]
+        return cls._merge_parallel(_aggregate_shard, pieces, workers)
+    
+    @classmethod
+    def parallel_files(cls, paths, workers=None):
+        """
+        Aggregate one CSV / JSON-lines file per worker task (e.g. one file per shard of
+        an export) and merge the results in the order of `paths`
+        """
+        return cls._merge_parallel(_aggregate_file, list(paths), workers or os.cpu_count() or 1)
+    
+    @classmethod
+    def _merge_parallel(cls, worker, tasks, workers):
+        analyzer = cls(backend="columnar", keep_rows=False)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            # map() yields results in task order, which keeps first-seen product order
+            for partial in pool.map(worker, tasks):
+                analyzer.aggregate.merge(partial)
+        return analyzer
+    
+    def append(self, transaction):
+        """Add one transaction (dict) and update the running totals"""
+        if self.keep_rows:
+            self._store(transaction)
+        self.aggregate.add(transaction['product'], transaction['revenue'])
+    
+    def _store(self, transaction):
+        """Keep one row and keep (or drop) the indexes in step with it"""
+        if self.backend == "columnar":
+            self.data.extend(SalesColumns.from_records([transaction]))
+            self._product_index = None
+        else:
+            if self._product_index is not None:
+                self._product_index.setdefault(transaction['product'], []).append(len(self.data))
+            self.data.append(transaction)
+        self._date_index = None
+    
+    def extend(self, transactions):
+        """Add many transactions (list of dicts or SalesColumns) and update the running totals"""
+        if self.backend == "list":
+            if isinstance(transactions, SalesColumns):
+                transactions = transactions.to_records()
+            for item in transactions:
+                self.append(item)
+            return
+
+        batch = transactions
+        if not isinstance(batch, SalesColumns):
+            batch = SalesColumns.from_records(list(batch))
+        if len(batch) == 0:
+            return
+        if self.keep_rows:
+            self.data.extend(batch)
+            self._product_index = None
+            self._date_index = None
+        # Aggregate the whole batch with NumPy, then fold it in once
+        self.aggregate.add_batch(batch.product_totals(), batch.revenue.sum().item(), len(batch))
     
     def total_revenue(self):
         """Calculate total revenue across all transactions"""
-        return sum(item['revenue'] for item in self.data)
+        return self.aggregate.total
     
     def top_product(self):
         """Find product with highest total revenue"""
-        product_revenue = {}
-        for item in self.data:
-            product = item['product']
-            if product in product_revenue:
-                product_revenue[product] += item['revenue']
-            else:
-                product_revenue[product] = item['revenue']
-        
-        top = max(product_revenue.items(), key=lambda x: x[1])
-        return {"product": top[0], "revenue": top[1]}
+        product, revenue = self.aggregate.top()
+        return {"product": product, "revenue": revenue}
     
     def average_order_value(self):
         """Calculate average order value"""
-        total_rev = self.total_revenue()
-        return total_rev / len(self.data)
+        return self.aggregate.average()
     
     def filter_by_product(self, product_name):
-        """Return all transactions for a specific product"""
-        return [item for item in self.data if item['product'] == product_name]
+        """
+        Return all transactions for a specific product, in arrival order
+        Columnar backend: returns a SalesColumns view (no copy) into the product index
+        """
+        self._require_rows()
+        index = self._build_product_index()
+        if self.backend == "columnar":
+            clustered, offsets = index
+            code = self.data.code_of(product_name)
+            if code is None:
+                return clustered.take(slice(0, 0))
+            return clustered.take(slice(offsets[code], offsets[code + 1]))
+        return [self.data[i] for i in index.get(product_name, [])]
+    
+    def filter_by_date(self, start_date, end_date):
+        """
+        Return transactions with start_date <= date <= end_date ('YYYY-MM-DD'), in date order
+        Columnar backend: returns a SalesColumns view (no copy) into the date index
+        """
+        self._require_rows()
+        if self.backend == "columnar":
+            clustered = self._build_date_index()
+            lo = np.searchsorted(clustered.dates, np.datetime64(start_date, 'D'), side='left')
+            hi = np.searchsorted(clustered.dates, np.datetime64(end_date, 'D'), side='right')
+            return clustered.take(slice(lo, hi))
+
+        dates, positions = self._build_date_index()
+        lo = bisect_left(dates, start_date)
+        hi = bisect_right(dates, end_date)
+        return [self.data[i] for i in positions[lo:hi]]
+    
+    def _require_rows(self):
+        if not self.keep_rows:
+            raise ValueError("Rows were not kept (keep_rows=False); only summary methods are available")
+    
+    def _build_product_index(self):
+        """
+        product -> row positions, built once and reused until the next ingest
+        Columnar: rows are copied once, clustered by product code, so each
+        product's rows are one contiguous slice (offsets[code]:offsets[code + 1])
+        """
+        if self._product_index is None:
+            if self.backend == "columnar":
+                codes = self.data.product_codes
+                order = np.argsort(codes, kind='stable')
+                counts = np.bincount(codes, minlength=len(self.data.products))
+                offsets = np.concatenate(([0], np.cumsum(counts)))
+                self._product_index = (self.data.take(order), offsets)
+            else:
+                index = {}
+                for i, item in enumerate(self.data):
+                    index.setdefault(item['product'], []).append(i)
+                self._product_index = index
+        return self._product_index
+    
+    def _build_date_index(self):
+        """Rows ordered by date (stable), for range lookups with binary search"""
+        if self._date_index is None:
+            if self.backend == "columnar":
+                order = np.argsort(self.data.dates, kind='stable')
+                self._date_index = self.data.take(order)
+            else:
+                positions = sorted(range(len(self.data)), key=lambda i: self.data[i]['date'])
+                self._date_index = ([self.data[i]['date'] for i in positions], positions)
+        return self._date_index
     
     def summary_report(self):
         """Generate complete summary report"""
         return {
             "total_revenue": self.total_revenue(),
-            "total_transactions": len(self.data),
+            "total_transactions": self.aggregate.count,
             "average_order_value": self.average_order_value(),
             "top_product": self.top_product()
         }
@@ -82,4 +284,44 @@ if __name__ == "__main__":
     print("="*60)
     summary = analyzer.summary_report()
     for key, value in summary.items():
-        print(f"{key}: {value}")
\ No newline at end of file
+        print(f"{key}: {value}")
+
+    # Same analysis on the columnar (NumPy) backend
+    columnar = SalesAnalyzer(sales, backend="columnar")
+    print(f"\n{'='*60}")
+    print("COLUMNAR BACKEND")
+    print("="*60)
+    print(f"Matches list backend: {columnar.summary_report() == summary}")
+    print(f"Laptop rows: {list(columnar.filter_by_product('Laptop'))}")
+    print(f"Column memory: {columnar.data.nbytes()} bytes")
+    print(f"Sales from 2025-01-02 to 2025-01-03: {list(columnar.filter_by_date('2025-01-02', '2025-01-03'))}")
+
+    # Live feed: totals stay current as new transactions arrive
+    columnar.append({"date": "2025-01-05", "product": "Mouse", "quantity": 300, "revenue": 150000})
+    print(f"\nAfter a new Mouse order: {columnar.summary_report()}")
+
+    # Streaming: summarize an export chunk by chunk without keeping the rows
+    import csv
+    import os
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "daily_export.csv")
+        with open(path, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=["date", "product", "quantity", "revenue"])
+            writer.writeheader()
+            writer.writerows(sales)
+
+        streamed = SalesAnalyzer.from_csv(path, chunk_size=2, backend="columnar", keep_rows=False)
+        print(f"\n{'='*60}")
+        print("STREAMED FROM CSV")
+        print("="*60)
+        print(f"Matches in-memory report: {streamed.summary_report() == summary}")
+        print(f"Ingest stats: {streamed.ingest_stats}")
+
+    # Parallel: aggregate shards in a process pool and merge the partial totals
+    sharded = SalesAnalyzer.parallel(sales, workers=2, shards=2)
+    print(f"\n{'='*60}")
+    print("PARALLEL (2 SHARDS)")
+    print("="*60)
+    print(f"Matches single-process report: {sharded.summary_report() == summary}")
\ No newline at end of file
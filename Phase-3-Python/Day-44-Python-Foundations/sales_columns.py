@@ -0,0 +1,195 @@
+# Day 44 - Columnar Storage for SalesAnalyzer
+# Typed NumPy arrays instead of a list of dicts
+
+import numpy as np
+
+
+class SalesColumns:
+    """
+    Columnar storage for sales transactions
+    quantity/revenue are typed arrays, product is dictionary-encoded,
+    date is stored as datetime64[D]
+
+    Integer revenue stays int64 so totals match the list path exactly;
+    float revenue is summed pairwise by NumPy and can differ in the last digit
+    """
+
+    def __init__(self, dates, product_codes, quantity, revenue, products, lookup=None):
+        """
+        dates: datetime64[D] array
+        product_codes: int32 array of positions into `products`
+        quantity, revenue: numeric arrays of the same length
+        products: list of product names (code -> name), in first-seen order
+        lookup: optional name -> code dict matching `products` (shared by subsets)
+        """
+        # Backing buffers may be larger than the data; only [:size] is live
+        self._dates = dates
+        self._product_codes = product_codes
+        self._quantity = quantity
+        self._revenue = revenue
+        self._size = len(revenue)
+        self.products = products
+        if lookup is None:
+            lookup = {name: code for code, name in enumerate(products)}
+        self._lookup = lookup
+
+    @classmethod
+    def empty(cls):
+        """Columns with no rows, ready to be extended"""
+        return cls(
+            dates=np.empty(0, dtype='datetime64[D]'),
+            product_codes=np.empty(0, dtype=np.int32),
+            quantity=np.empty(0, dtype=np.int64),
+            revenue=np.empty(0, dtype=np.int64),
+            products=[],
+        )
+
+    @classmethod
+    def from_records(cls, records):
+        """
+        Build columns from a list of dicts with keys:
+        'date', 'product', 'quantity', 'revenue'
+        """
+        products = []
+        lookup = {}
+        codes = []
+        for item in records:
+            product = item['product']
+            code = lookup.get(product)
+            if code is None:
+                code = len(products)
+                lookup[product] = code
+                products.append(product)
+            codes.append(code)
+
+        revenue = [item['revenue'] for item in records]
+        # Keep integer revenue exact; only fall back to float64 when needed
+        revenue_dtype = np.int64 if all(isinstance(r, int) for r in revenue) else np.float64
+
+        return cls(
+            dates=np.array([item['date'] for item in records], dtype='datetime64[D]'),
+            product_codes=np.array(codes, dtype=np.int32),
+            quantity=np.array([item['quantity'] for item in records], dtype=np.int64),
+            revenue=np.array(revenue, dtype=revenue_dtype),
+            products=products,
+        )
+
+    @property
+    def dates(self):
+        return self._dates[:self._size]
+
+    @property
+    def product_codes(self):
+        return self._product_codes[:self._size]
+
+    @property
+    def quantity(self):
+        return self._quantity[:self._size]
+
+    @property
+    def revenue(self):
+        return self._revenue[:self._size]
+
+    def __len__(self):
+        return self._size
+
+    def __iter__(self):
+        """Yield rows back as dicts, in the same shape as the list path"""
+        for i in range(len(self)):
+            yield self.row(i)
+
+    def row(self, i):
+        """Return row i as a dict"""
+        return {
+            "date": str(self._dates[i]),
+            "product": self.products[self._product_codes[i]],
+            "quantity": self._quantity[i].item(),
+            "revenue": self._revenue[i].item(),
+        }
+
+    def to_records(self):
+        """Convert back to a list of dicts"""
+        return list(self)
+
+    def code_of(self, product_name):
+        """Dictionary code for a product, or None if it never appears"""
+        return self._lookup.get(product_name)
+
+    def take(self, selector):
+        """Subset rows with a boolean mask, index array or slice"""
+        return SalesColumns(
+            dates=self.dates[selector],
+            product_codes=self.product_codes[selector],
+            quantity=self.quantity[selector],
+            revenue=self.revenue[selector],
+            products=self.products,
+            lookup=self._lookup,
+        )
+
+    def extend(self, other):
+        """
+        Append the rows of another SalesColumns in place
+        Buffers grow by doubling, so repeated appends are amortized O(1) per row
+        """
+        # Re-encode the other side's product codes into this dictionary
+        mapping = np.empty(len(other.products), dtype=np.int32)
+        copied = False
+        for code, name in enumerate(other.products):
+            own = self._lookup.get(name)
+            if own is None:
+                if not copied:
+                    # The dictionary may be shared with the parent / other
+                    # subsets (see take()); add new names to a private copy
+                    self.products = list(self.products)
+                    self._lookup = dict(self._lookup)
+                    copied = True
+                own = len(self.products)
+                self._lookup[name] = own
+                self.products.append(name)
+            mapping[code] = own
+
+        n = len(other)
+        if self._revenue.dtype != other.revenue.dtype:
+            self._revenue = self._revenue.astype(np.result_type(self._revenue, other.revenue))
+        self._reserve(self._size + n)
+
+        end = self._size + n
+        self._dates[self._size:end] = other.dates
+        self._product_codes[self._size:end] = mapping[other.product_codes]
+        self._quantity[self._size:end] = other.quantity
+        self._revenue[self._size:end] = other.revenue
+        self._size = end
+
+    def _reserve(self, capacity):
+        """Make sure the backing buffers can hold `capacity` rows"""
+        if capacity <= len(self._revenue):
+            return
+        new_capacity = max(capacity, 2 * len(self._revenue), 16)
+        for name in ("_dates", "_product_codes", "_quantity", "_revenue"):
+            old = getattr(self, name)
+            grown = np.empty(new_capacity, dtype=old.dtype)
+            grown[:self._size] = old[:self._size]
+            setattr(self, name, grown)
+
+    def revenue_by_product(self):
+        """Total revenue per product code (array indexed by code)"""
+        totals = np.zeros(len(self.products), dtype=self.revenue.dtype)
+        np.add.at(totals, self.product_codes, self.revenue)
+        return totals
+
+    def product_totals(self):
+        """
+        Revenue per product as a dict, for products present in these rows only,
+        ordered by first appearance (the same order a dict loop would give)
+        """
+        if self._size == 0:
+            return {}
+        totals = self.revenue_by_product()
+        present, first_row = np.unique(self.product_codes, return_index=True)
+        ordered = present[np.argsort(first_row)]
+        return {self.products[code]: totals[code].item() for code in ordered}
+
+    def nbytes(self):
+        """Memory used by the column arrays"""
+        return (self.dates.nbytes + self.product_codes.nbytes
+                + self.quantity.nbytes + self.revenue.nbytes)
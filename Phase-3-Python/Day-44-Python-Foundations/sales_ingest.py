@@ -0,0 +1,67 @@
+# Day 44 - Streaming Ingestion for SalesAnalyzer
+# Read CSV / JSON-lines exports in fixed-size chunks
+
+import csv
+import json
+import sys
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+def _to_number(text):
+    """Parse '80000' as int and '799.50' as float"""
+    try:
+        return int(text)
+    except ValueError:
+        return float(text)
+
+
+def _chunked(rows, chunk_size):
+    """Group an iterator of transactions into lists of at most chunk_size"""
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) == chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def read_csv_chunks(path, chunk_size=100_000):
+    """
+    Yield lists of transaction dicts from a CSV file
+    The file needs a header with: date, product, quantity, revenue
+    """
+    with open(path, newline='', encoding='utf-8') as f:
+        rows = (
+            {
+                "date": row['date'],
+                "product": row['product'],
+                "quantity": int(row['quantity']),
+                "revenue": _to_number(row['revenue']),
+            }
+            for row in csv.DictReader(f)
+        )
+        yield from _chunked(rows, chunk_size)
+
+
+def read_jsonl_chunks(path, chunk_size=100_000):
+    """Yield lists of transaction dicts from a JSON-lines file (one object per line)"""
+    with open(path, encoding='utf-8') as f:
+        rows = (json.loads(line) for line in f if line.strip())
+        yield from _chunked(rows, chunk_size)
+
+
+def peak_rss_mb():
+    """Peak resident memory of this process in MB (None where unsupported)"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KB, macOS reports bytes
+    if sys.platform == 'darwin':
+        return peak / (1024 * 1024)
+    return peak / 1024
@@ -0,0 +1,279 @@
+# Day 44 - Scalable Versions of tasks.py Helpers
+# Same results as the scalar functions, without Python loops
+
+from itertools import islice
+
+import numpy as np
+import pandas as pd
+
+# Bonus tiers from calculate_bonus(): under 20k -> 0%, [20k, 40k) -> 5%, [40k, 60k) -> 8%, 60k+ -> 12%
+BONUS_THRESHOLDS = np.array([20000.0, 40000.0, 60000.0])
+BONUS_RATES = np.array([0.0, 0.05, 0.08, 0.12])
+
+
+def _as_float_array(values):
+    """NumPy float64 view of a list / array / Series"""
+    return np.asarray(values, dtype=np.float64)
+
+
+def _chunked(values, chunk_size):
+    """Yield lists of up to chunk_size items from any iterable"""
+    iterator = iter(values)
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _like(result, original):
+    """Return a Series (same index and name) when the input was a Series"""
+    if isinstance(original, pd.Series):
+        return pd.Series(result, index=original.index, name=original.name)
+    return result
+
+
+def calculate_bonus_batch(sales):
+    """
+    Array version of calculate_bonus()
+    Tier lookup with searchsorted, then one multiply per row
+    """
+    values = _as_float_array(sales)
+    tier = np.searchsorted(BONUS_THRESHOLDS, values, side='right')
+    # Tier 0 is a literal 0 in the scalar version (not sales * 0.0, which gives -0.0 for negatives)
+    bonus = np.where(tier == 0, 0.0, values * BONUS_RATES[tier])
+    return _like(bonus, sales)
+
+
+def categorize_performance_batch(values, thresholds):
+    """
+    Array version of categorize_performance()
+    np.select mirrors the if/elif chain, including unsorted thresholds and NaN
+    """
+    data = _as_float_array(values)
+    labels = np.select(
+        [data < thresholds[0], data < thresholds[1]],
+        ["Low", "Medium"],
+        default="High",
+    )
+    return _like(labels, values)
+
+
+def calculate_growth_rate_batch(old_values, new_values):
+    """
+    Array version of calculate_growth_rate()
+    Raises ZeroDivisionError on a zero old value, like the scalar version
+    """
+    old = _as_float_array(old_values)
+    new = _as_float_array(new_values)
+    if np.any(old == 0):
+        raise ZeroDivisionError("old_value contains 0")
+    growth = ((new - old) / old) * 100
+    return _like(growth, new_values)
+
+
+class ReservoirSample:
+    """
+    Bounded-memory approximate quantiles for unbounded streams
+    Keeps a uniform random sample of at most `size` values (reservoir sampling);
+    quantile error shrinks roughly as 1 / sqrt(size)
+    """
+
+    def __init__(self, size=10_000, seed=42):
+        self.size = size
+        self.seen = 0
+        self.sample = np.empty(0)
+        self._rng = np.random.default_rng(seed)
+
+    def update(self, chunk):
+        """Add a chunk (array) of values to the sample"""
+        chunk = np.asarray(chunk, dtype=np.float64)
+        free = self.size - len(self.sample)
+        if free > 0:
+            self.sample = np.concatenate([self.sample, chunk[:free]])
+            self.seen += min(free, len(chunk))
+            chunk = chunk[free:]
+        if len(chunk) == 0:
+            return
+        # Value number i (0-based) replaces a random slot with probability size / (i + 1)
+        positions = np.arange(self.seen, self.seen + len(chunk))
+        slots = self._rng.integers(0, positions + 1)
+        keep = slots < self.size
+        self.sample[slots[keep]] = chunk[keep]
+        self.seen += len(chunk)
+
+    def quantile(self, q):
+        """Approximate q-quantile (same position rule as summary_stats: sorted[int(q * n)])"""
+        if len(self.sample) == 0:
+            raise ValueError("No values in sample")
+        k = min(int(q * len(self.sample)), len(self.sample) - 1)
+        return np.partition(self.sample, k)[k].item()
+
+
+class StreamingStats:
+    """
+    Single-pass version of summary_stats() for generators and chunked input
+    exact=True keeps the cleaned values (as one compact array) for an exact median
+    by selection (np.partition, O(n)); exact=False keeps only a ReservoirSample
+    """
+
+    def __init__(self, exact=True, sample_size=10_000):
+        self.exact = exact
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = None
+        self._chunks = []
+        self._sample = None if exact else ReservoirSample(sample_size)
+
+    def update(self, chunk):
+        """Fold one chunk of raw values in (None, 0 and negatives are dropped like clean_data)"""
+        if isinstance(chunk, (np.ndarray, pd.Series)):
+            values = np.asarray(clean_array(chunk))
+        else:
+            values = np.asarray(list(iter_clean(chunk)))
+        if len(values) == 0:
+            return
+        self.count += len(values)
+        self.total += values.sum().item()
+        low, high = values.min().item(), values.max().item()
+        self.min = low if self.min is None else min(self.min, low)
+        self.max = high if self.max is None else max(self.max, high)
+        if self.exact:
+            self._chunks.append(values)
+        else:
+            self._sample.update(values)
+
+    def median(self):
+        """Upper median, matching sorted(values)[n // 2]"""
+        if self.exact:
+            values = np.concatenate(self._chunks)
+            self._chunks = [values]
+            k = len(values) // 2
+            return np.partition(values, k)[k].item()
+        return self._sample.quantile(0.5)
+
+    def result(self):
+        """Same keys as summary_stats()"""
+        if self.count == 0:
+            raise ValueError("No valid values")
+        return {
+            "mean": self.total / self.count,
+            "median": self.median(),
+            "max": self.max,
+            "min": self.min,
+            "count": self.count,
+        }
+
+
+def summary_stats_stream(values, exact=True, chunk_size=65_536):
+    """
+    summary_stats() over any iterable (list, generator, file reader) in one pass
+    Reads chunk_size values at a time, so the raw input is never held as one list
+    """
+    stats = StreamingStats(exact=exact)
+    for chunk in _chunked(values, chunk_size):
+        stats.update(chunk)
+    return stats.result()
+
+
+# Pipeline stages: each takes an iterable and yields lazily, so they chain
+# clean -> stats -> categorize without building intermediate lists
+
+def iter_clean(values):
+    """Lazy clean_data(): yield values that are not None, 0 or negative"""
+    for x in values:
+        if x and x > 0:
+            yield x
+
+
+def clean_array(values):
+    """
+    clean_data() for arrays / Series with a boolean mask
+    None becomes NaN in a float array, and NaN > 0 is False, so it is dropped too
+    """
+    data = values if isinstance(values, (np.ndarray, pd.Series)) else np.asarray(values, dtype=np.float64)
+    if data.dtype == object:
+        data = data.astype(np.float64)
+    return data[data > 0]
+
+
+def iter_track(values, stats, chunk_size=65_536):
+    """Pass values through unchanged while folding them into a StreamingStats"""
+    for chunk in _chunked(values, chunk_size):
+        stats.update(chunk)
+        yield from chunk
+
+
+def iter_categorize(values, thresholds):
+    """Lazy categorize_performance(): yield (value, label) pairs"""
+    low, high = thresholds[0], thresholds[1]
+    for x in values:
+        if x < low:
+            yield x, "Low"
+        elif x < high:
+            yield x, "Medium"
+        else:
+            yield x, "High"
+
+
+def read_values(path):
+    """Yield one number per line of a text file (blank or 'None' lines -> None)"""
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            text = line.strip()
+            if not text or text == 'None':
+                yield None
+            elif text.lstrip('-').isdigit():
+                yield int(text)
+            else:
+                yield float(text)
+
+
+if __name__ == "__main__":
+    import time
+
+    print("="*50)
+    print("BATCH HELPERS")
+    print("="*50)
+
+    test_sales = [15000, 25000, 45000, 75000]
+    print(f"Bonuses: {calculate_bonus_batch(test_sales)}")
+    print(f"Performance: {categorize_performance_batch([15000, 35000, 65000], [20000, 50000])}")
+    print(f"Growth Rates: {calculate_growth_rate_batch([1000, 2000], [1500, 1800])}")
+
+    team = pd.Series([18000, 52000, 61000], index=["Rahul", "Priya", "Amit"], name="sales")
+    print(f"\nBonus by salesperson:\n{calculate_bonus_batch(team)}")
+
+    test_data = [100, 200, None, 0, -50, 300, 150]
+    print(f"\nStreaming Summary Stats: {summary_stats_stream(iter(test_data))}")
+
+    print(f"Mask-cleaned array: {clean_array(np.array([100, 200, np.nan, 0, -50, 300, 150]))}")
+
+    # File pipeline: clean -> stats -> categorize, one value at a time
+    import os
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "sales.txt")
+        with open(path, "w") as f:
+            f.write("\n".join(str(x) for x in [15000, None, 35000, -200, 0, 65000, 42000]))
+
+        stats = StreamingStats()
+        label_counts = {}
+        for value, label in iter_categorize(iter_track(iter_clean(read_values(path)), stats), [20000, 50000]):
+            label_counts[label] = label_counts.get(label, 0) + 1
+        print(f"Pipeline categories: {label_counts}")
+        print(f"Pipeline stats: {stats.result()}")
+
+    # One million payouts
+    rng = np.random.default_rng(42)
+    payouts = rng.integers(0, 100_000, size=1_000_000)
+    start = time.perf_counter()
+    calculate_bonus_batch(payouts)
+    elapsed = time.perf_counter() - start
+    print(f"\n1,000,000 bonuses in {elapsed * 1000:.1f} ms")
+
+    exact = summary_stats_stream(payouts)
+    approx = summary_stats_stream(payouts, exact=False)
+    print(f"Exact median: {exact['median']:,}  |  Approximate median: {approx['median']:,.0f}")
@@ -0,0 +1,197 @@
+# Day 45 - Reproducible Benchmark Suite
+# Warmups, repeated perf_counter_ns runs, several sizes, JSON output
+
+import argparse
+import json
+import os
+import platform
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_SIZES = [1_000, 10_000, 100_000, 1_000_000]
+PRODUCTS = np.array(['Laptop', 'Mouse', 'Keyboard', 'Monitor', 'Headphones'])
+REGIONS = np.array(['North', 'South', 'East', 'West'])
+
+
+def time_runs(func, repeats=7, warmup=2):
+    """Call func() warmup times untimed, then `repeats` times; return durations in ns"""
+    for _ in range(warmup):
+        func()
+    durations = []
+    for _ in range(repeats):
+        start = time.perf_counter_ns()
+        func()
+        durations.append(time.perf_counter_ns() - start)
+    return durations
+
+
+def peak_memory(func):
+    """Peak bytes allocated (tracemalloc, includes NumPy buffers) during one call"""
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def summarize(durations, size):
+    """Median / IQR / min in ns plus rows per second at the median"""
+    q1, median, q3 = np.percentile(durations, [25, 50, 75])
+    return {
+        "median_ns": int(median),
+        "iqr_ns": int(q3 - q1),
+        "min_ns": int(min(durations)),
+        "throughput_rows_per_sec": size / (median / 1e9) if median > 0 else None,
+    }
+
+
+# ---------------------------------------------------------------------------
+# Benchmark cases: setup(size) builds the input once, run(state) is timed
+# ---------------------------------------------------------------------------
+
+def make_sales_frame(size, seed=42):
+    """Sales-like DataFrame (same columns as Day 47's sales_data.csv)"""
+    rng = np.random.default_rng(seed)
+    quantity = rng.integers(1, 20, size)
+    unit_price = rng.integers(500, 50000, size)
+    return pd.DataFrame({
+        'Date': pd.Timestamp('2026-01-01') + pd.to_timedelta(rng.integers(0, 365, size), unit='D'),
+        'Product': PRODUCTS[rng.integers(0, len(PRODUCTS), size)],
+        'Region': REGIONS[rng.integers(0, len(REGIONS), size)],
+        'Quantity': quantity,
+        'Unit_Price': unit_price,
+        'Revenue': quantity * unit_price,
+    })
+
+
+def _csv_path(size):
+    return os.path.join(tempfile.gettempdir(), f"benchmark_sales_{size}.csv")
+
+
+def _setup_csv_read(size):
+    path = _csv_path(size)
+    make_sales_frame(size).to_csv(path, index=False)
+    return path
+
+
+CASES = {
+    "list_discount": {
+        "setup": lambda size: list(range(size)),
+        "run": lambda prices: [price * 0.9 for price in prices],
+        "max_size": 10_000_000,
+    },
+    "numpy_discount": {
+        "setup": lambda size: np.arange(size),
+        "run": lambda prices: prices * 0.9,
+        "max_size": None,
+    },
+    "groupby_sum": {
+        "setup": make_sales_frame,
+        "run": lambda df: df.groupby('Product')['Revenue'].sum(),
+        "max_size": 100_000_000,
+    },
+    "pivot_table": {
+        "setup": make_sales_frame,
+        "run": lambda df: df.pivot_table(values='Revenue', index='Region',
+                                         columns='Product', aggfunc='sum'),
+        "max_size": 100_000_000,
+    },
+    "csv_write": {
+        "setup": lambda size: (make_sales_frame(size), _csv_path(size)),
+        "run": lambda state: state[0].to_csv(state[1], index=False),
+        "max_size": 10_000_000,
+    },
+    "csv_read": {
+        "setup": _setup_csv_read,
+        "run": lambda path: pd.read_csv(path, parse_dates=['Date']),
+        "max_size": 10_000_000,
+    },
+}
+
+
+def run_suite(sizes=DEFAULT_SIZES, cases=None, repeats=7, warmup=2):
+    """Run every case at every size; returns a JSON-ready dict"""
+    results = []
+    for name in cases or CASES:
+        case = CASES[name]
+        for size in sizes:
+            if case["max_size"] is not None and size > case["max_size"]:
+                results.append({"case": name, "size": size, "skipped": "size above max_size"})
+                continue
+            state = case["setup"](size)
+            durations = time_runs(lambda: case["run"](state), repeats=repeats, warmup=warmup)
+            result = {"case": name, "size": size, "repeats": repeats, "warmup": warmup}
+            result.update(summarize(durations, size))
+            result["peak_memory_bytes"] = peak_memory(lambda: case["run"](state))
+            results.append(result)
+            print(f"{name:<16} n={size:>12,}  median {result['median_ns'] / 1e6:>10.3f} ms"
+                  f"  IQR {result['iqr_ns'] / 1e6:>8.3f} ms"
+                  f"  peak {result['peak_memory_bytes'] / 1e6:>9.1f} MB")
+            del state
+            if os.path.exists(_csv_path(size)):
+                os.remove(_csv_path(size))
+
+    return {
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "environment": {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "pandas": pd.__version__,
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+        },
+        "results": results,
+    }
+
+
+def compare(current, baseline, tolerance=0.10):
+    """Print cases whose median got slower than baseline by more than `tolerance`"""
+    previous = {(r["case"], r["size"]): r for r in baseline["results"] if "median_ns" in r}
+    regressions = []
+    for result in current["results"]:
+        old = previous.get((result["case"], result["size"]))
+        if old is None or "median_ns" not in result:
+            continue
+        ratio = result["median_ns"] / old["median_ns"]
+        if ratio > 1 + tolerance:
+            regressions.append((result["case"], result["size"], ratio))
+            print(f"REGRESSION {result['case']} n={result['size']:,}: {ratio:.2f}x slower")
+    if not regressions:
+        print("No regressions against baseline")
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the project's hot operations")
+    parser.add_argument("--sizes", nargs="+", type=float, default=DEFAULT_SIZES,
+                        help="row counts, e.g. 1e3 1e6 1e8")
+    parser.add_argument("--cases", nargs="+", choices=sorted(CASES), default=None)
+    parser.add_argument("--repeats", type=int, default=7)
+    parser.add_argument("--warmup", type=int, default=2)
+    parser.add_argument("--output", default="benchmark_results.json")
+    parser.add_argument("--baseline", help="previous results JSON to check for regressions")
+    args = parser.parse_args()
+
+    # Read the baseline first, in case --output points at the same file
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+    print("="*60)
+    print("BENCHMARK SUITE")
+    print("="*60)
+    report = run_suite([int(s) for s in args.sizes], args.cases, args.repeats, args.warmup)
+
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"\n✅ Results saved to '{args.output}'")
+
+    if baseline is not None:
+        compare(report, baseline)
@@ -2,7 +2,8 @@
 # Prove why NumPy is essential
 
 import numpy as np
-import time
+
+from benchmark_suite import time_runs
 
 print("="*60)
 print("SPEED TEST: NUMPY VS PYTHON LISTS")
@@ -16,22 +17,16 @@ print(f"\nDataset size: {size:,} elements")
 print("\n--- PYTHON LISTS ---")
 py_list = list(range(size))
 
-start = time.time()
-# Calculate 10% discount
-discounted_list = [price * 0.9 for price in py_list]
-end = time.time()
-py_time = end - start
+# Calculate 10% discount (median of 5 timed runs after a warmup)
+py_time = np.median(time_runs(lambda: [price * 0.9 for price in py_list], repeats=5, warmup=1)) / 1e9
 print(f"Time taken: {py_time:.4f} seconds")
 
 # NumPy approach
 print("\n--- NUMPY ARRAY ---")
 np_array = np.arange(size)
 
-start = time.time()
-# Calculate 10% discount
-discounted_array = np_array * 0.9
-end = time.time()
-np_time = end - start
+# Calculate 10% discount (median of 5 timed runs after a warmup)
+np_time = np.median(time_runs(lambda: np_array * 0.9, repeats=5, warmup=1)) / 1e9
 print(f"Time taken: {np_time:.4f} seconds")
 
 # Comparison
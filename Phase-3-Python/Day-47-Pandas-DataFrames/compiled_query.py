@@ -0,0 +1,228 @@
+# Day 47 - Compiled Queries
+# Parse a df.query() string once, then run it many times
+
+import ast
+import io
+import operator
+import re
+import sys
+import tokenize
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+OPERATORS = {
+    ast.Eq: '==', ast.NotEq: '!=',
+    ast.Gt: '>', ast.GtE: '>=',
+    ast.Lt: '<', ast.LtE: '<=',
+    ast.In: 'in', ast.NotIn: 'not in',
+}
+COMPARE = {
+    '==': operator.eq, '!=': operator.ne,
+    '>': operator.gt, '>=': operator.ge,
+    '<': operator.lt, '<=': operator.le,
+}
+# a < Revenue  ->  Revenue > a
+FLIPPED = {'==': '==', '!=': '!=', '>': '<', '>=': '<=', '<': '>', '<=': '>='}
+SAMPLE_ROWS = 2_048
+
+# @name outside of quoted strings
+_AT_VARIABLE = re.compile(r'("[^"]*"|\'[^\']*\')|@([A-Za-z_]\w*)')
+_VAR_PREFIX = '__at_'
+# df.query() gives & / | the precedence of and / or
+_BOOLEAN_OPERATORS = {'&': 'and', '|': 'or'}
+
+
+class _Comparison:
+    """`column op value`, where value is a constant, a list, or an @variable"""
+
+    def __init__(self, column, op, value=None, variable=None):
+        self.column = column
+        self.op = op
+        self.value = value
+        self.variable = variable
+
+    def evaluate(self, df, rows, bindings):
+        """Boolean mask for the given row positions (None = every row)"""
+        value = bindings[self.variable] if self.variable else self.value
+        series = df[self.column]
+
+        if isinstance(series.dtype, pd.CategoricalDtype) and self.op in ('==', '!=', 'in', 'not in'):
+            # Decide once per category, then look the answer up by code
+            categories = series.cat.categories
+            if self.op in ('in', 'not in'):
+                hits = categories.isin(list(value))
+            else:
+                hits = categories == value
+            if self.op in ('!=', 'not in'):
+                hits = ~hits
+            # Code -1 (missing) indexes the extra last slot: only != / not in match it
+            lookup = np.append(np.asarray(hits, dtype=bool), self.op in ('!=', 'not in'))
+            codes = series.cat.codes.to_numpy()
+            return lookup[codes if rows is None else codes[rows]]
+
+        values = series.to_numpy()
+        if rows is not None:
+            values = values[rows]
+        if values.dtype.kind == 'M':
+            value = ([np.datetime64(pd.Timestamp(v)) for v in value] if self.op in ('in', 'not in')
+                     else np.datetime64(pd.Timestamp(value)))
+        if self.op == 'in':
+            return np.isin(values, list(value))
+        if self.op == 'not in':
+            return ~np.isin(values, list(value))
+        return np.asarray(COMPARE[self.op](values, value), dtype=bool)
+
+
+class _BoolOp:
+    """and / or over child predicates, evaluated with short-circuit on row subsets"""
+
+    def __init__(self, kind, children):
+        self.kind = kind
+        self.children = children
+
+    def evaluate(self, df, rows, bindings):
+        n = len(df) if rows is None else len(rows)
+        positions = np.arange(n)
+        # `and`: rows still alive; `or`: rows not yet matched
+        pending = positions
+        mask = np.zeros(n, dtype=bool) if self.kind == 'or' else None
+        for child in self.children:
+            subset = pending if rows is None else rows[pending]
+            hit = child.evaluate(df, subset, bindings)
+            if self.kind == 'and':
+                pending = pending[hit]
+            else:
+                mask[pending[hit]] = True
+                pending = pending[~hit]
+            if len(pending) == 0:
+                break
+        if self.kind == 'and':
+            mask = np.zeros(n, dtype=bool)
+            mask[pending] = True
+        return mask
+
+
+class _Not:
+    def __init__(self, child):
+        self.child = child
+
+    def evaluate(self, df, rows, bindings):
+        return ~self.child.evaluate(df, rows, bindings)
+
+
+def _literal(node):
+    """Python value of a constant / list / tuple / negative-number node"""
+    return ast.literal_eval(node)
+
+
+def _replace_booleans(source):
+    """`a > 1 & b == 2` -> `a > 1 and b == 2` (operators inside strings are left alone)"""
+    tokens = tokenize.generate_tokens(io.StringIO(source).readline)
+    return tokenize.untokenize(
+        (tokenize.NAME, _BOOLEAN_OPERATORS[token.string])
+        if token.type == tokenize.OP and token.string in _BOOLEAN_OPERATORS
+        else (token.type, token.string)
+        for token in tokens
+    )
+
+
+def _build(node):
+    """AST node -> predicate tree"""
+    if isinstance(node, ast.BoolOp):
+        kind = 'and' if isinstance(node.op, ast.And) else 'or'
+        return _BoolOp(kind, [_build(value) for value in node.values])
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.Not, ast.Invert)):
+        return _Not(_build(node.operand))
+    if isinstance(node, ast.Compare):
+        # a < b < c  ->  (a < b) and (b < c)
+        parts = []
+        left = node.left
+        for op_node, right in zip(node.ops, node.comparators):
+            parts.append(_build_comparison(left, OPERATORS[type(op_node)], right))
+            left = right
+        return parts[0] if len(parts) == 1 else _BoolOp('and', parts)
+    raise ValueError(f"Unsupported expression: {ast.unparse(node)}")
+
+
+def _build_comparison(left, op, right):
+    if not isinstance(left, ast.Name) or left.id.startswith(_VAR_PREFIX):
+        if isinstance(right, ast.Name) and not right.id.startswith(_VAR_PREFIX) and op in FLIPPED:
+            left, right, op = right, left, FLIPPED[op]
+        else:
+            raise ValueError(f"Expected a column on one side of {op!r}")
+    if isinstance(right, ast.Name):
+        if not right.id.startswith(_VAR_PREFIX):
+            raise ValueError(f"Column-to-column comparisons are not supported: {left.id} {op} {right.id}")
+        return _Comparison(left.id, op, variable=right.id[len(_VAR_PREFIX):])
+    return _Comparison(left.id, op, value=_literal(right))
+
+
+class CompiledQuery:
+    """
+    A df.query() expression parsed once into a predicate plan
+    - @variables are bound at run time (keyword arguments, else the caller's variables)
+    - top-level `and` terms run most-selective first, each only on the rows
+      that survived the previous terms (short-circuit masks)
+    """
+
+    def __init__(self, expression):
+        self.expression = expression
+        source = _AT_VARIABLE.sub(lambda m: m.group(1) or _VAR_PREFIX + m.group(2), expression)
+        tree = _build(ast.parse(_replace_booleans(source.strip()), mode='eval').body)
+        self.conjuncts = tree.children if isinstance(tree, _BoolOp) and tree.kind == 'and' else [tree]
+        self.variables = sorted(set(re.findall(r'@([A-Za-z_]\w*)', expression)))
+
+    def _bindings(self, values, frame):
+        bindings = {}
+        for name in self.variables:
+            if name in values:
+                bindings[name] = values[name]
+            elif name in frame.f_locals:
+                bindings[name] = frame.f_locals[name]
+            elif name in frame.f_globals:
+                bindings[name] = frame.f_globals[name]
+            else:
+                raise NameError(f"@{name} is not bound")
+        return bindings
+
+    def order(self, df, bindings):
+        """Conjuncts sorted by estimated selectivity (fraction of a row sample that passes)"""
+        if len(self.conjuncts) == 1 or len(df) <= SAMPLE_ROWS:
+            return self.conjuncts
+        sample = np.linspace(0, len(df) - 1, SAMPLE_ROWS).astype(np.int64)
+        estimates = [conjunct.evaluate(df, sample, bindings).mean() for conjunct in self.conjuncts]
+        return [self.conjuncts[i] for i in np.argsort(estimates, kind='stable')]
+
+    def mask(self, df, **variables):
+        """Boolean row mask (positional), like the one df.query() would use"""
+        bindings = self._bindings(variables, sys._getframe(1))
+        return self._mask(df, bindings)
+
+    def _mask(self, df, bindings):
+        rows = None
+        for conjunct in self.order(df, bindings):
+            hit = conjunct.evaluate(df, rows, bindings)
+            rows = np.flatnonzero(hit) if rows is None else rows[hit]
+            if len(rows) == 0:
+                break
+        mask = np.zeros(len(df), dtype=bool)
+        mask[rows if rows is not None else slice(None)] = True
+        return mask
+
+    def run(self, df, **variables):
+        """Matching rows of df (same result as df.query(expression))"""
+        bindings = self._bindings(variables, sys._getframe(1))
+        return df[self._mask(df, bindings)]
+
+    __call__ = run
+
+    def __repr__(self):
+        return f"CompiledQuery({self.expression!r})"
+
+
+@lru_cache(maxsize=256)
+def compile_query(expression):
+    """Cached CompiledQuery: the same string is only ever parsed once"""
+    return CompiledQuery(expression)
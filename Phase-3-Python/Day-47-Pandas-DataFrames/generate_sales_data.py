@@ -0,0 +1,97 @@
+# Day 47 - Large Synthetic Sales Data Generator
+# Chunked, parallel and reproducible (same output for any number of workers)
+
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+PRODUCTS = np.array(['Laptop', 'Mouse', 'Keyboard', 'Monitor', 'Headphones'])
+REGIONS = np.array(['North', 'South', 'East', 'West'])
+START_DATE = np.datetime64('2026-01-01', 'D')
+
+
+def shard_rng(seed, shard_id):
+    """
+    Independent random stream for one shard
+    Keyed on (seed, shard_id) only, so a shard's rows never depend on
+    which worker produced it or how many workers there are
+    """
+    return np.random.default_rng(np.random.SeedSequence(seed, spawn_key=(shard_id,)))
+
+
+def generate_shard(shard_id, first_row, n_rows, seed=42, n_days=365):
+    """
+    Build one shard of sales rows (same columns as sales_data.csv)
+    Dates cycle through n_days days starting at 2026-01-01, by global row number
+    """
+    rng = shard_rng(seed, shard_id)
+    row_numbers = np.arange(first_row, first_row + n_rows)
+    quantity = rng.integers(1, 20, n_rows)
+    unit_price = rng.integers(500, 50000, n_rows)
+    return pd.DataFrame({
+        'Date': START_DATE + (row_numbers % n_days),
+        'Product': PRODUCTS[rng.integers(0, len(PRODUCTS), n_rows)],
+        'Region': REGIONS[rng.integers(0, len(REGIONS), n_rows)],
+        'Quantity': quantity,
+        'Unit_Price': unit_price,
+        'Revenue': quantity * unit_price,
+    })
+
+
+def shard_path(output_dir, shard_id):
+    return os.path.join(output_dir, f"sales_data_part_{shard_id:05d}.csv")
+
+
+def _write_shard(task):
+    """Worker: generate one shard and write it straight to its own file"""
+    shard_id, first_row, n_rows, seed, n_days, output_dir = task
+    path = shard_path(output_dir, shard_id)
+    generate_shard(shard_id, first_row, n_rows, seed, n_days).to_csv(path, index=False)
+    return path, n_rows
+
+
+def generate_partitioned(total_rows, output_dir, shard_rows=1_000_000, workers=None,
+                         seed=42, n_days=365):
+    """
+    Write total_rows rows as sales_data_part_NNNNN.csv files of shard_rows each
+    Each worker holds one shard at a time, so memory stays at ~shard_rows rows per worker
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    tasks = [
+        (shard_id, first_row, min(shard_rows, total_rows - first_row), seed, n_days, output_dir)
+        for shard_id, first_row in enumerate(range(0, total_rows, shard_rows))
+    ]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        # Only (path, rows) comes back from each worker; results arrive in shard order
+        for path, n_rows in pool.map(_write_shard, tasks):
+            yield path, n_rows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate partitioned synthetic sales data")
+    parser.add_argument("--rows", type=float, default=1e6, help="total rows, e.g. 1e9")
+    parser.add_argument("--shard-rows", type=float, default=1e6)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--days", type=int, default=365, help="date range the rows cycle through")
+    parser.add_argument("--output-dir", default="sales_data_parts")
+    args = parser.parse_args()
+
+    print("="*70)
+    print("GENERATING PARTITIONED SALES DATA")
+    print("="*70)
+
+    start = time.perf_counter()
+    written = 0
+    for path, n_rows in generate_partitioned(int(args.rows), args.output_dir, int(args.shard_rows),
+                                             args.workers, args.seed, args.days):
+        written += n_rows
+        print(f"  {path}: {n_rows:,} rows")
+    elapsed = time.perf_counter() - start
+
+    print(f"\n✅ {written:,} rows written to '{args.output_dir}' in {elapsed:.1f}s "
+          f"({written / elapsed:,.0f} rows/sec)")
@@ -0,0 +1,110 @@
+# Day 47 - Top-K Rows per Group
+# groupby().apply(lambda x: x.nlargest(k, col)) without a Python call per group
+
+import heapq
+
+import numpy as np
+import pandas as pd
+
+
+def _descending_key(values):
+    """Sort key that orders values largest-first (datetimes compared as int64)"""
+    if values.dtype.kind == 'M':
+        values = values.view(np.int64)
+    elif values.dtype.kind in 'ub':
+        values = values.astype(np.int64)
+    return -values
+
+
+def _with_group_keys(result, group_col):
+    """Prepend the group value as an index level, like groupby(group_keys=True).apply"""
+    result.index = pd.MultiIndex.from_arrays([result[group_col], result.index],
+                                             names=[group_col, result.index.name])
+    return result
+
+
+def _top_k_positions(df, group_col, value_col, k):
+    """Row positions of the top-k rows per group, already in output order"""
+    values = df[value_col].to_numpy()
+    codes, _ = pd.factorize(df[group_col], sort=True)
+    valid = codes >= 0
+    if values.dtype.kind == 'f':
+        valid &= ~np.isnan(values)
+    positions = np.flatnonzero(valid)
+    if len(positions) == 0:
+        return positions
+
+    # lexsort is stable: primary key group code, then value descending, ties keep row order
+    order = positions[np.lexsort((_descending_key(values[positions]), codes[positions]))]
+    sorted_codes = codes[order]
+
+    # Rank inside each group = distance from the first row of that group
+    starts = np.flatnonzero(np.r_[True, sorted_codes[1:] != sorted_codes[:-1]])
+    group_start = np.repeat(starts, np.diff(np.r_[starts, len(order)]))
+    rank = np.arange(len(order)) - group_start
+    return order[rank < k]
+
+
+def top_k_per_group(df, group_col, value_col, k, group_keys=False):
+    """
+    The k rows with the largest value_col in each group, in one sort
+    Same rows and order as
+        df.groupby(group_col, group_keys=group_keys).apply(lambda x: x.nlargest(k, value_col))
+    groups in sorted key order, largest value first, ties by original row order,
+    NaN values and NaN keys left out
+    """
+    result = df.iloc[_top_k_positions(df, group_col, value_col, k)]
+    return _with_group_keys(result.copy(), group_col) if group_keys else result
+
+
+class StreamingTopK:
+    """
+    Top-k per group over data that arrives in chunks (e.g. read_csv(chunksize=...))
+    Each chunk is first cut down with top_k_per_group, then merged into one
+    size-k min-heap per group; memory is O(groups * k) rows.
+    result() matches top_k_per_group on the concatenated chunks.
+    """
+
+    def __init__(self, group_col, value_col, k):
+        self.group_col = group_col
+        self.value_col = value_col
+        self.k = k
+        self.columns = None
+        self.dtypes = None
+        self.index_name = None
+        self.rows_seen = 0
+        self._heaps = {}   # group -> [(value, -position, position, index label, row tuple)]
+
+    def update(self, chunk):
+        """Fold one DataFrame chunk in"""
+        if self.columns is None:
+            self.columns = list(chunk.columns)
+            self.dtypes = chunk.dtypes
+            self.index_name = chunk.index.name
+        local = _top_k_positions(chunk, self.group_col, self.value_col, self.k)
+        best = chunk.iloc[local]
+        positions = self.rows_seen + local
+        self.rows_seen += len(chunk)
+
+        value_at = self.columns.index(self.value_col)
+        group_at = self.columns.index(self.group_col)
+        for position, label, row in zip(positions, best.index, best.itertuples(index=False, name=None)):
+            # Smallest value is evicted first; among equal values the latest row goes first
+            entry = (row[value_at], -position, position, label, row)
+            heap = self._heaps.setdefault(row[group_at], [])
+            if len(heap) < self.k:
+                heapq.heappush(heap, entry)
+            elif entry[:2] > heap[0][:2]:
+                heapq.heapreplace(heap, entry)
+
+    def result(self, group_keys=False):
+        """Top-k rows per group as a DataFrame (groups sorted, largest value first)"""
+        entries = []
+        for group in sorted(self._heaps):
+            # By row order, then (stable) by value descending: ties stay in row order
+            by_position = sorted(self._heaps[group], key=lambda e: e[2])
+            entries.extend(sorted(by_position, key=lambda e: e[0], reverse=True))
+        result = pd.DataFrame([e[4] for e in entries], columns=self.columns,
+                              index=pd.Index([e[3] for e in entries], name=self.index_name))
+        result = result.astype(self.dtypes.to_dict())
+        return _with_group_keys(result, self.group_col) if group_keys else result
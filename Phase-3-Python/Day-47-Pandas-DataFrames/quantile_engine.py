@@ -0,0 +1,134 @@
+# Day 47 - Quantile Engine
+# Exact quantiles by selection, approximate ones from a mergeable sketch
+
+import numpy as np
+import pandas as pd
+
+
+def _clean(values):
+    """1-D float64 array without NaN (Series, list or array in)"""
+    values = np.asarray(values, dtype=np.float64).ravel()
+    return values[~np.isnan(values)]
+
+
+def exact_quantile(values, q):
+    """
+    Same numbers as Series.quantile(q) (linear interpolation), using
+    np.partition on the 2 neighbours of each requested position instead of a sort
+    q: a float, or a list of floats (one partition pass for all of them)
+    Returns a float, or a Series indexed by q like Series.quantile([...])
+    """
+    values = _clean(values)
+    qs = np.atleast_1d(np.asarray(q, dtype=np.float64))
+    if ((qs < 0) | (qs > 1)).any():
+        raise ValueError("Quantiles must be between 0 and 1")
+    n = len(values)
+    if n == 0:
+        result = np.full(len(qs), np.nan)
+    else:
+        # Same index / interpolation arithmetic as np.quantile(method='linear'),
+        # so results match bit for bit
+        virtual = (n - 1) * qs
+        below = np.clip(np.floor(virtual), 0, n - 1).astype(np.int64)
+        above = np.clip(below + 1, 0, n - 1)
+        gamma = virtual - np.floor(virtual)
+        part = np.partition(values, np.unique(np.r_[below, above]))
+        a, b = part[below], part[above]
+        diff = b - a
+        result = np.where(gamma >= 0.5, b - diff * (1 - gamma), a + diff * gamma)
+    if np.ndim(q) == 0:
+        return float(result[0])
+    return pd.Series(result, index=pd.Index(qs))
+
+
+class QuantileSketch:
+    """
+    KLL-style quantile sketch: bounded memory, updated per chunk, mergeable
+    Level h holds items that each stand for 2**h original values. When a level
+    overflows it is sorted and every other item (random offset) moves up a level.
+    Memory is about 3 * k items whatever the stream length; rank error ~ 1/k.
+    """
+
+    def __init__(self, k=200, seed=None):
+        self.k = k
+        self.count = 0
+        self.min = np.inf
+        self.max = -np.inf
+        self.levels = [np.empty(0)]
+        self._rng = np.random.default_rng(seed)
+
+    def _capacity(self, level):
+        # Lower levels get geometrically smaller buffers (2/3 per level down)
+        depth = len(self.levels) - 1 - level
+        return max(2, int(np.ceil(self.k * (2 / 3) ** depth)))
+
+    def update(self, values):
+        """Add a batch of values (a chunk column, list or array; NaN ignored)"""
+        values = _clean(values)
+        if len(values) == 0:
+            return self
+        self.count += len(values)
+        self.min = min(self.min, values.min())
+        self.max = max(self.max, values.max())
+        self.levels[0] = np.concatenate([self.levels[0], values])
+        self._compress()
+        return self
+
+    def merge(self, other):
+        """Fold another sketch in (e.g. one per worker / file); returns self"""
+        if other.count == 0:
+            return self
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.empty(0))
+        for level, items in enumerate(other.levels):
+            self.levels[level] = np.concatenate([self.levels[level], items])
+        self.count += other.count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self._compress()
+        return self
+
+    def _compress(self):
+        level = 0
+        while level < len(self.levels):
+            items = self.levels[level]
+            if len(items) > self._capacity(level):
+                if level + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+                items = np.sort(items)
+                # An odd item out stays behind so total weight is preserved
+                keep = items[-1:] if len(items) % 2 else items[:0]
+                pairs = items[:len(items) - len(keep)]
+                promoted = pairs[self._rng.integers(2)::2]
+                self.levels[level] = keep
+                self.levels[level + 1] = np.concatenate([self.levels[level + 1], promoted])
+            level += 1
+
+    def _weighted(self):
+        values = np.concatenate(self.levels)
+        weights = np.concatenate([np.full(len(items), 2 ** level, dtype=np.int64)
+                                  for level, items in enumerate(self.levels)])
+        order = np.argsort(values, kind='stable')
+        return values[order], np.cumsum(weights[order])
+
+    def quantile(self, q):
+        """Approximate q-quantile (float), or a Series for a list of q"""
+        qs = np.atleast_1d(np.asarray(q, dtype=np.float64))
+        if self.count == 0:
+            result = np.full(len(qs), np.nan)
+        else:
+            values, cumulative = self._weighted()
+            positions = np.searchsorted(cumulative, qs * cumulative[-1], side='left')
+            result = values[np.minimum(positions, len(values) - 1)]
+            # The ends are tracked exactly
+            result = np.where(qs <= 0, self.min, np.where(qs >= 1, self.max, result))
+        if np.ndim(q) == 0:
+            return float(result[0])
+        return pd.Series(result, index=pd.Index(qs))
+
+    def size(self):
+        """Items currently stored (the sketch's memory footprint)"""
+        return sum(len(items) for items in self.levels)
+
+    def __len__(self):
+        return self.count
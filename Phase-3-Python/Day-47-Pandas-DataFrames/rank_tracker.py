@@ -0,0 +1,158 @@
+# Day 47 - Live Rankings
+# Keep Revenue_Rank / Rank_Within_Region / Percentile_Rank current as rows arrive
+
+import math
+from bisect import bisect_left, bisect_right, insort
+
+import numpy as np
+import pandas as pd
+
+
+class _Fenwick:
+    """Prefix sums over block sizes, O(log blocks) per update / query"""
+
+    def __init__(self, sizes):
+        self.tree = [0] * (len(sizes) + 1)
+        for i, size in enumerate(sizes):
+            self.add(i, size)
+
+    def add(self, i, delta):
+        i += 1
+        while i < len(self.tree):
+            self.tree[i] += delta
+            i += i & -i
+
+    def prefix(self, i):
+        """Sum of sizes of blocks [0, i)"""
+        total = 0
+        while i > 0:
+            total += self.tree[i]
+            i -= i & -i
+        return total
+
+
+class OrderStatistics:
+    """
+    Sorted multiset of values in fixed-size sorted blocks
+    insert: O(log n + block_size); count below / at a value: O(log n)
+    """
+
+    def __init__(self, values=(), block_size=512):
+        self.block_size = block_size
+        ordered = sorted(v for v in values if not _is_missing(v))
+        self._blocks = [ordered[i:i + block_size] for i in range(0, len(ordered), block_size)]
+        self._reindex()
+
+    def _reindex(self):
+        self._maxes = [block[-1] for block in self._blocks]
+        self._sizes = _Fenwick([len(block) for block in self._blocks])
+        self._count = sum(len(block) for block in self._blocks)
+
+    def __len__(self):
+        return self._count
+
+    def insert(self, value):
+        """Add one value (NaN / None are ignored, as rank() leaves them out)"""
+        if _is_missing(value):
+            return
+        if not self._blocks:
+            self._blocks = [[value]]
+            self._reindex()
+            return
+        i = min(bisect_left(self._maxes, value), len(self._blocks) - 1)
+        block = self._blocks[i]
+        insort(block, value)
+        self._maxes[i] = block[-1]
+        self._sizes.add(i, 1)
+        self._count += 1
+        if len(block) > 2 * self.block_size:
+            # Split the full block; block positions shift, so rebuild the index (rare)
+            self._blocks[i:i + 1] = [block[:self.block_size], block[self.block_size:]]
+            self._reindex()
+
+    def count_less(self, value):
+        """Number of stored values < value"""
+        i = bisect_left(self._maxes, value)
+        if i == len(self._blocks):
+            return self._count
+        return self._sizes.prefix(i) + bisect_left(self._blocks[i], value)
+
+    def count_less_equal(self, value):
+        """Number of stored values <= value"""
+        i = bisect_right(self._maxes, value)
+        if i == len(self._blocks):
+            return self._count
+        return self._sizes.prefix(i) + bisect_right(self._blocks[i], value)
+
+    def rank(self, value, ascending=True):
+        """Average rank of value among the stored values (pandas rank(method='average'))"""
+        if _is_missing(value) or self._count == 0:
+            return math.nan
+        below = self.count_less(value)
+        ties = self.count_less_equal(value) - below
+        before = below if ascending else self._count - below - ties
+        return before + (ties + 1) / 2
+
+    def percentile(self, value, ascending=True):
+        """rank / count, like rank(pct=True)"""
+        if self._count == 0:
+            return math.nan
+        return self.rank(value, ascending) / self._count
+
+
+def _is_missing(value):
+    return value is None or (isinstance(value, float) and math.isnan(value))
+
+
+class RankTracker:
+    """
+    Leaderboard over a growing table: global and per-group ranks of value_col
+    add() new rows as they arrive; rank queries never re-sort the table
+    """
+
+    def __init__(self, value_col='Revenue', group_col='Region', df=None, block_size=512):
+        self.value_col = value_col
+        self.group_col = group_col
+        self.block_size = block_size
+        self.overall = OrderStatistics(block_size=block_size)
+        self.groups = {}
+        if df is not None:
+            self.overall = OrderStatistics(df[value_col].tolist(), block_size)
+            # groupby drops missing groups, as groupby().rank() leaves them unranked
+            for group, values in df.groupby(group_col, observed=True)[value_col]:
+                self.groups[group] = OrderStatistics(values.tolist(), block_size)
+
+    def add(self, rows):
+        """Insert new rows (DataFrame with value_col and group_col)"""
+        for value, group in zip(rows[self.value_col].tolist(), rows[self.group_col].tolist()):
+            self.overall.insert(value)
+            if pd.isna(group):
+                continue   # no within-group rank for a missing group
+            if group not in self.groups:
+                self.groups[group] = OrderStatistics(block_size=self.block_size)
+            self.groups[group].insert(value)
+
+    def rank(self, value, group=None, ascending=False):
+        """Rank of a value overall, or within `group` (largest = 1 by default)"""
+        stats = self.overall if group is None else self.groups[group]
+        return stats.rank(value, ascending)
+
+    def percentile_rank(self, value, group=None, ascending=True):
+        """Percentile rank (0-1], like rank(pct=True)"""
+        stats = self.overall if group is None else self.groups[group]
+        return stats.percentile(value, ascending)
+
+    def rank_rows(self, rows):
+        """
+        Revenue_Rank, Rank_Within_Region and Percentile_Rank for the given rows,
+        as of everything added so far
+        """
+        values = rows[self.value_col].tolist()
+        groups = rows[self.group_col].tolist()
+        return pd.DataFrame({
+            'Revenue_Rank': [self.overall.rank(v, ascending=False) for v in values],
+            'Rank_Within_Region': [self.groups[g].rank(v, ascending=False)
+                                   if not pd.isna(g) and g in self.groups else np.nan
+                                   for v, g in zip(values, groups)],
+            'Percentile_Rank': [self.overall.percentile(v) for v in values],
+        }, index=rows.index)
@@ -2,16 +2,17 @@
 # Author: Syamprasad
 # Date: February 17, 2026
 
-import pandas as pd
 import numpy as np
 
+from quantile_engine import exact_quantile
+from sales_data_loader import load_sales_data
+
 print("="*70)
 print("SALES PERFORMANCE ANALYSIS - EXECUTIVE REPORT")
 print("="*70)
 
 # Load data
-df = pd.read_csv('sales_data.csv')
-df['Date'] = pd.to_datetime(df['Date'])
+df = load_sales_data('sales_data.csv')  # Typed columns, cached after the first parse
 
 print(f"\nDataset Overview:")
 print(f"Total Transactions: {len(df):,}")
@@ -26,6 +27,8 @@ print("="*70)
 total_revenue = df['Revenue'].sum()
 avg_revenue = df['Revenue'].mean()
 median_revenue = df['Revenue'].median()
+# All distribution cut points in one selection pass
+revenue_quantiles = exact_quantile(df['Revenue'], [0.25, 0.50, 0.75, 0.90])
 
 print(f"Total Revenue: ₹{total_revenue:,.2f}")
 print(f"Average Transaction Value: ₹{avg_revenue:,.2f}")
@@ -34,13 +37,13 @@ print(f"Median Transaction Value: ₹{median_revenue:,.2f}")
 # Revenue distribution
 print(f"\nRevenue Distribution:")
 print(f"Min: ₹{df['Revenue'].min():,.2f}")
-print(f"25th Percentile: ₹{df['Revenue'].quantile(0.25):,.2f}")
-print(f"50th Percentile (Median): ₹{df['Revenue'].quantile(0.50):,.2f}")
-print(f"75th Percentile: ₹{df['Revenue'].quantile(0.75):,.2f}")
+print(f"25th Percentile: ₹{revenue_quantiles[0.25]:,.2f}")
+print(f"50th Percentile (Median): ₹{revenue_quantiles[0.50]:,.2f}")
+print(f"75th Percentile: ₹{revenue_quantiles[0.75]:,.2f}")
 print(f"Max: ₹{df['Revenue'].max():,.2f}")
 
 # High value transactions (top 10%)
-high_value_threshold = df['Revenue'].quantile(0.90)
+high_value_threshold = revenue_quantiles[0.90]
 high_value_count = len(df[df['Revenue'] >= high_value_threshold])
 high_value_revenue = df[df['Revenue'] >= high_value_threshold]['Revenue'].sum()
 
@@ -0,0 +1,353 @@
+# Day 47 - Cached Loader for sales_data.csv
+# Parse the CSV once into typed binary columns, then memory-map them
+
+import hashlib
+import json
+import operator
+import os
+
+import numpy as np
+import pandas as pd
+
+DATE_COLUMNS = ('Date',)
+# Small per-row counts/prices; Revenue stays int64 so group sums cannot overflow
+INT32_COLUMNS = ('Quantity', 'Unit_Price')
+CACHE_VERSION = 4
+# Rows per row group; min/max per group let scans skip groups that cannot match
+ROW_GROUP_SIZE = 65_536
+
+
+def default_cache_dir(csv_path):
+    """sales_data.csv -> .sales_data_cache/ next to the CSV"""
+    folder, name = os.path.split(os.path.abspath(csv_path))
+    return os.path.join(folder, f".{os.path.splitext(name)[0]}_cache")
+
+
+def file_sha256(path, block_size=1 << 20):
+    """SHA-256 of a file, read in 1 MB blocks"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(block_size), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _int_dtype(values):
+    """int32 when every value fits (half the memory of int64), int64 otherwise"""
+    info = np.iinfo(np.int32)
+    if len(values) == 0 or (info.min <= values.min() and values.max() <= info.max):
+        return np.int32
+    return np.int64
+
+
+def _row_group_stats(values):
+    """
+    Min, max and NaN / NaT count of each ROW_GROUP_SIZE block (datetimes as int64 ns), as lists
+    Missing values are left out of min/max (NaN only for a block with no other value)
+    """
+    if len(values) == 0:
+        return [], [], []
+    starts = np.arange(0, len(values), ROW_GROUP_SIZE)
+    if values.dtype.kind == 'M':
+        missing = np.isnat(values)
+        values = values.view(np.int64)
+        info = np.iinfo(np.int64)
+        nulls = np.add.reduceat(missing, starts)
+        low = np.minimum.reduceat(np.where(missing, info.max, values), starts)
+        high = np.maximum.reduceat(values, starts)   # NaT is int64 min, never the max
+        all_missing = nulls == np.diff(np.append(starts, len(values)))
+        return ([np.nan if empty else v for v, empty in zip(low.tolist(), all_missing)],
+                [np.nan if empty else v for v, empty in zip(high.tolist(), all_missing)],
+                nulls.tolist())
+    if values.dtype.kind == 'f':
+        nulls = np.add.reduceat(np.isnan(values), starts).tolist()
+    else:
+        nulls = [0] * len(starts)
+    return (np.fmin.reduceat(values, starts).tolist(),
+            np.fmax.reduceat(values, starts).tolist(),
+            nulls)
+
+
+def _read_meta(cache_dir):
+    try:
+        with open(os.path.join(cache_dir, 'meta.json')) as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return meta if meta.get('version') == CACHE_VERSION else None
+
+
+def _write_meta(cache_dir, meta):
+    # Write then rename, so a crash never leaves a half-written meta.json
+    tmp_path = os.path.join(cache_dir, 'meta.json.tmp')
+    with open(tmp_path, 'w') as f:
+        json.dump(meta, f, indent=2)
+    os.replace(tmp_path, os.path.join(cache_dir, 'meta.json'))
+
+
+def _save_column(cache_dir, name, values):
+    """
+    Write <name>.npy through a temp file and rename it into place. Frames
+    already loaded keep memory-mapping the old file; overwriting it in place
+    would truncate the pages under them (SIGBUS on the next access)
+    """
+    tmp_path = os.path.join(cache_dir, f"{name}.npy.tmp")
+    with open(tmp_path, 'wb') as f:
+        np.save(f, values)
+    os.replace(tmp_path, os.path.join(cache_dir, f"{name}.npy"))
+
+
+def build_cache(csv_path, cache_dir, date_columns=DATE_COLUMNS, int32_columns=INT32_COLUMNS):
+    """
+    Parse the CSV once and store each column as a .npy file:
+    - text columns    -> category codes + categories in meta.json
+    - date columns    -> datetime64[ns]
+    - int32_columns   -> int32 when the values fit (other integers stay int64)
+    Per-row-group min/max/NaN count of every column (codes for categories) go in meta.json,
+    which is replaced last, after every column file is in place
+    """
+    df = pd.read_csv(csv_path)
+    os.makedirs(cache_dir, exist_ok=True)
+
+    columns = []
+    for name in df.columns:
+        series = df[name]
+        if name in date_columns:
+            values = pd.to_datetime(series).to_numpy(dtype='datetime64[ns]')
+            column = {'name': name, 'kind': 'datetime'}
+        elif name in int32_columns and pd.api.types.is_integer_dtype(series):
+            values = series.to_numpy()
+            values = values.astype(_int_dtype(values))
+            column = {'name': name, 'kind': 'numeric'}
+        elif pd.api.types.is_numeric_dtype(series) or pd.api.types.is_bool_dtype(series):
+            values = series.to_numpy()
+            column = {'name': name, 'kind': 'numeric'}
+        else:
+            categorical = pd.Categorical(series)
+            values = categorical.codes
+            column = {'name': name, 'kind': 'category',
+                      'categories': categorical.categories.tolist()}
+        _save_column(cache_dir, name, values)
+        column['min'], column['max'], column['nulls'] = _row_group_stats(values)
+        columns.append(column)
+
+    stat = os.stat(csv_path)
+    meta = {
+        'version': CACHE_VERSION,
+        'source_mtime_ns': stat.st_mtime_ns,
+        'source_size': stat.st_size,
+        'source_sha256': file_sha256(csv_path),
+        'rows': len(df),
+        'row_group_size': ROW_GROUP_SIZE,
+        'columns': columns,
+    }
+    _write_meta(cache_dir, meta)
+    return meta
+
+
+def ensure_cache(csv_path, cache_dir=None, date_columns=DATE_COLUMNS):
+    """
+    Return the cache metadata, rebuilding only if the CSV really changed:
+    same mtime + size -> reuse; otherwise compare SHA-256 before re-parsing
+    """
+    cache_dir = cache_dir or default_cache_dir(csv_path)
+    meta = _read_meta(cache_dir)
+    stat = os.stat(csv_path)
+
+    if meta is not None:
+        if meta['source_mtime_ns'] == stat.st_mtime_ns and meta['source_size'] == stat.st_size:
+            return meta
+        if meta['source_size'] == stat.st_size and meta['source_sha256'] == file_sha256(csv_path):
+            # Touched but not changed: remember the new mtime and keep the cache
+            meta['source_mtime_ns'] = stat.st_mtime_ns
+            _write_meta(cache_dir, meta)
+            return meta
+
+    return build_cache(csv_path, cache_dir, date_columns)
+
+
+def load_column(cache_dir, column):
+    """Memory-map one cached column and wrap it in its pandas type"""
+    values = np.load(os.path.join(cache_dir, f"{column['name']}.npy"), mmap_mode='r')
+    if column['kind'] == 'category':
+        return pd.Categorical.from_codes(values, categories=column['categories'])
+    return values
+
+
+def load_sales_data(csv_path='sales_data.csv', columns=None, cache_dir=None):
+    """
+    Drop-in for pd.read_csv(csv_path) + pd.to_datetime(df['Date'])
+    Text columns come back as category, Quantity / Unit_Price as int32,
+    dates as datetime64; only the requested columns are read from disk
+    """
+    cache_dir = cache_dir or default_cache_dir(csv_path)
+    meta = ensure_cache(csv_path, cache_dir)
+    by_name = {column['name']: column for column in meta['columns']}
+    if columns is None:
+        columns = list(by_name)
+    missing = [name for name in columns if name not in by_name]
+    if missing:
+        raise KeyError(f"Columns not in {csv_path}: {missing}")
+    wanted = [by_name[name] for name in columns]
+    return pd.DataFrame({column['name']: load_column(cache_dir, column) for column in wanted},
+                        copy=False)
+
+
+# ---------------------------------------------------------------------------
+# Scans with projection and predicate pushdown
+# ---------------------------------------------------------------------------
+
+COMPARISONS = {
+    '==': operator.eq, '!=': operator.ne,
+    '>': operator.gt, '>=': operator.ge,
+    '<': operator.lt, '<=': operator.le,
+}
+STRING_TESTS = {
+    'startswith': lambda text, value: text.startswith(value),
+    'endswith': lambda text, value: text.endswith(value),
+    'contains': lambda text, value: value.lower() in text.lower(),  # like str.contains(case=False)
+}
+
+
+def _matching_codes(column, op, value):
+    """
+    Evaluate a predicate once per category (not once per row)
+    Returns a boolean lookup table indexed by category code, plus a last
+    slot for code -1 (missing): only != and 'not in' match a missing value
+    """
+    categories = column['categories']
+    if op in COMPARISONS:
+        hits = [COMPARISONS[op](category, value) for category in categories]
+    elif op == 'in':
+        hits = [category in value for category in categories]
+    elif op == 'not in':
+        hits = [category not in value for category in categories]
+    elif op in STRING_TESTS:
+        hits = [STRING_TESTS[op](category, value) for category in categories]
+    else:
+        raise ValueError(f"Unsupported operator for text column {column['name']!r}: {op!r}")
+    return np.array(hits + [op in ('!=', 'not in')], dtype=bool)
+
+
+def _group_may_match(low, high, nulls, op, value):
+    """Can a row group with this min/max / NaN count contain a row where `x op value` holds?"""
+    if nulls and op in ('!=', 'not in'):
+        return True   # NaN != value holds
+    if low != low:
+        return False  # only NaN in the group: no other comparison holds
+    if op == '==':
+        return low <= value <= high
+    if op == '!=':
+        return not (low == high == value)
+    if op == '>':
+        return high > value
+    if op == '>=':
+        return high >= value
+    if op == '<':
+        return low < value
+    if op == '<=':
+        return low <= value
+    if op == 'in':
+        return any(low <= v <= high for v in value)
+    return True
+
+
+def _not_missing_test(test):
+    """Datetime test on the int64 view: NaT (int64 min) never matches, as in pandas"""
+    nat = np.iinfo(np.int64).min
+    return lambda values: test(values) & (values != nat)
+
+
+def _is_list(value):
+    return isinstance(value, (list, tuple, set, frozenset))
+
+
+def _stored_value(column, value):
+    """Filter value in the stored representation (datetimes as int64 ns)"""
+    if column['kind'] == 'datetime':
+        if _is_list(value):
+            return [pd.Timestamp(v).value for v in value]
+        return pd.Timestamp(value).value
+    return value
+
+
+def scan_sales_data(csv_path='sales_data.csv', columns=None, filters=(), cache_dir=None):
+    """
+    Read only what a query needs from the column cache
+    columns: columns to return (default: all)
+    filters: list of (column, op, value), all must hold (AND)
+             ops: == != > >= < <= in, 'not in', startswith, endswith, contains
+    Row groups whose min/max rule out a match are skipped without being read;
+    text predicates run on the category dictionary, then as a code lookup per row.
+    Returns the matching rows with their original row numbers as the index.
+    """
+    cache_dir = cache_dir or default_cache_dir(csv_path)
+    meta = ensure_cache(csv_path, cache_dir)
+    by_name = {column['name']: column for column in meta['columns']}
+    columns = list(by_name) if columns is None else list(columns)
+    missing = [name for name in columns + [f[0] for f in filters] if name not in by_name]
+    if missing:
+        raise KeyError(f"Columns not in {csv_path}: {missing}")
+
+    rows, group_size = meta['rows'], meta['row_group_size']
+    n_groups = len(meta['columns'][0]['min']) if meta['columns'] else 0
+    keep_group = np.ones(n_groups, dtype=bool)
+
+    # Plan: turn each filter into (column, test) and prune row groups with the stats
+    plan = []
+    for name, op, value in filters:
+        column = by_name[name]
+        if op in ('in', 'not in') and not _is_list(value):
+            # A string would otherwise match by substring ('A' in 'AB')
+            raise ValueError(f"{name!r} {op}: expected a list / tuple / set of values, got {value!r}")
+        if column['kind'] == 'category':
+            lookup = _matching_codes(column, op, value)
+            codes = np.flatnonzero(lookup[:-1])
+            lo, hi = (codes.min(), codes.max()) if len(codes) else (None, None)
+            # Group code stats include -1 when the group has a missing value
+            keep_group &= [(lo is not None and low <= hi and high >= lo) or (lookup[-1] and low < 0)
+                           for low, high in zip(column['min'], column['max'])]
+            plan.append((column, lambda codes, lookup=lookup: lookup[codes]))
+        else:
+            stored = _stored_value(column, value)
+            keep_group &= [_group_may_match(low, high, nulls, op, stored)
+                           for low, high, nulls in zip(column['min'], column['max'], column['nulls'])]
+            if op in COMPARISONS:
+                test = lambda values, op=op, value=stored: COMPARISONS[op](values, value)
+            elif op in ('in', 'not in'):
+                test = lambda values, op=op, value=stored: np.isin(values, value, invert=(op == 'not in'))
+            else:
+                raise ValueError(f"Unsupported operator for column {name!r}: {op!r}")
+            if column['kind'] == 'datetime' and op not in ('!=', 'not in'):
+                test = _not_missing_test(test)
+            plan.append((column, test))
+
+    # Evaluate predicates only inside the surviving row groups
+    arrays = {}
+
+    def raw(column):
+        if column['name'] not in arrays:
+            values = np.load(os.path.join(cache_dir, f"{column['name']}.npy"), mmap_mode='r')
+            arrays[column['name']] = values.view(np.int64) if column['kind'] == 'datetime' else values
+        return arrays[column['name']]
+
+    selected = []
+    for group in np.flatnonzero(keep_group):
+        start, stop = group * group_size, min((group + 1) * group_size, rows)
+        mask = np.ones(stop - start, dtype=bool)
+        for column, test in plan:
+            mask &= test(raw(column)[start:stop])
+            if not mask.any():
+                break
+        selected.append(start + np.flatnonzero(mask))
+    row_ids = np.concatenate(selected) if selected else np.empty(0, dtype=np.int64)
+
+    # Projection: only the requested columns are touched, and only at the selected rows
+    result = {}
+    for name in columns:
+        column = by_name[name]
+        values = np.load(os.path.join(cache_dir, f"{name}.npy"), mmap_mode='r')[row_ids]
+        if column['kind'] == 'category':
+            values = pd.Categorical.from_codes(values, categories=column['categories'])
+        result[name] = values
+    return pd.DataFrame(result, index=pd.Index(row_ids))
@@ -2,12 +2,13 @@
 # Author: Syamprasad
 # Date: February 17, 2026
 
-import pandas as pd
 import numpy as np
 
+from compiled_query import compile_query
+from sales_data_loader import load_sales_data, scan_sales_data
+
 # Load the sample data we created
-df = pd.read_csv('sales_data.csv')
-df['Date'] = pd.to_datetime(df['Date'])  # Convert to datetime
+df = load_sales_data('sales_data.csv')  # Typed columns, cached after the first parse
 
 print("="*70)
 print("SALES DATA OVERVIEW")
@@ -164,6 +165,39 @@ filtered = df.query('Revenue > @min_revenue')
 print(f"\nRevenue > {min_revenue} (using variable in query):")
 print(filtered.head())
 
+# Compiled queries: parsed once, reused with new @variable values
+north_laptops_query = compile_query('Region == "North" and Product == "Laptop" and Revenue > 50000')
+print("\nComplex query (compiled once):")
+print(north_laptops_query.run(df))
+
+revenue_above = compile_query('Revenue > @min_revenue')
+for threshold in [80000, 200000, 500000]:
+    print(f"Revenue > {threshold:,} (compiled, rebound): {len(revenue_above.run(df, min_revenue=threshold))} rows")
+
+print("\n" + "="*70)
+print("PART 7: SCANS WITH PUSHDOWN (FOR LARGE FILES)")
+print("="*70)
+
+# Same filters as above, but the columns and predicates are given up front:
+# only the needed columns are read, row groups that cannot match are skipped,
+# and text predicates are checked once per category instead of once per row
+high_revenue_scan = scan_sales_data('sales_data.csv', columns=['Product', 'Region', 'Revenue'],
+                                    filters=[('Revenue', '>', 100000)])
+print(f"Revenue > 100,000 (scan): {len(high_revenue_scan)} rows")
+
+north_laptops_scan = scan_sales_data('sales_data.csv', columns=['Date', 'Revenue'],
+                                     filters=[('Region', '==', 'North'), ('Product', '==', 'Laptop')])
+print("\nNorth region Laptop sales (scan):")
+print(north_laptops_scan)
+
+north_south_scan = scan_sales_data('sales_data.csv', columns=['Region', 'Revenue'],
+                                   filters=[('Region', 'in', ['North', 'South'])])
+print(f"\nNorth or South regions (scan): {len(north_south_scan)} rows")
+
+products_start_h_scan = scan_sales_data('sales_data.csv', columns=['Product'],
+                                        filters=[('Product', 'startswith', 'H')])
+print(f"Products starting with 'H' (scan): {list(products_start_h_scan['Product'].unique())}")
+
 print("\n" + "="*70)
 print("SELECTING & INDEXING COMPLETE ✅")
 print("="*70)
\ No newline at end of file
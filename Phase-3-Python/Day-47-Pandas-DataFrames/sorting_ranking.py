@@ -4,9 +4,13 @@
 
 import pandas as pd
 
+from group_topk import top_k_per_group
+from quantile_engine import QuantileSketch, exact_quantile
+from rank_tracker import RankTracker
+from sales_data_loader import load_sales_data
+
 # Load data
-df = pd.read_csv('sales_data.csv')
-df['Date'] = pd.to_datetime(df['Date'])
+df = load_sales_data('sales_data.csv')  # Typed columns, cached after the first parse
 
 print("="*70)
 print("PART 1: SORTING BY SINGLE COLUMN")
@@ -73,6 +77,18 @@ df['Percentile_Rank'] = df['Revenue'].rank(pct=True)
 print("\nPercentile rank:")
 print(df[['Product', 'Revenue', 'Percentile_Rank']].sort_values('Revenue', ascending=False).head(10))
 
+# Live ranks: keep the three rank columns current as new sales arrive,
+# without re-ranking the whole table (same numbers as the rank() calls above)
+half = len(df) // 2
+tracker = RankTracker('Revenue', 'Region', df=df.iloc[:half])
+tracker.add(df.iloc[half:])
+live = tracker.rank_rows(df)
+print("\nLive ranks match rank():",
+      live.equals(df[['Revenue_Rank', 'Rank_Within_Region', 'Percentile_Rank']]))
+tracker.add(pd.DataFrame({'Region': ['North'], 'Revenue': [5000]}))
+print("New 5,000 sale in North -> overall rank:", tracker.rank(5000),
+      "| within North:", tracker.rank(5000, group='North'))
+
 print("\n" + "="*70)
 print("PART 5: FINDING TOP N AND BOTTOM N")
 print("="*70)
@@ -88,9 +104,9 @@ print("\nBottom 10 revenue sales:")
 print(bottom_10[['Date', 'Product', 'Region', 'Revenue']])
 
 # Top 5 by Revenue for each Region
-top_per_region = df.groupby('Region', group_keys=False).apply(
-    lambda x: x.nlargest(5, 'Revenue')
-)
+# (same rows as groupby('Region').apply(lambda x: x.nlargest(5, 'Revenue')),
+#  but one sort instead of a Python call per group)
+top_per_region = top_k_per_group(df, 'Region', 'Revenue', 5)
 print("\nTop 5 sales per region:")
 print(top_per_region[['Region', 'Product', 'Revenue']])
 
@@ -111,17 +127,23 @@ print(region_revenue)
 print(f"\n🏆 Best region: {region_revenue.index[0]} (₹{region_revenue.iloc[0]:,.2f})")
 
 # Scenario 3: Identify underperforming sales (bottom 25%)
-threshold = df['Revenue'].quantile(0.25)
+threshold = exact_quantile(df['Revenue'], 0.25)  # == df['Revenue'].quantile(0.25), by selection
 underperforming = df[df['Revenue'] < threshold]
 print(f"\nUnderperforming sales (bottom 25%, Revenue < ₹{threshold:,.2f}):")
 print(f"Count: {len(underperforming)}")
 print(underperforming[['Product', 'Region', 'Revenue']].head(10))
 
+# Same threshold from a bounded-memory sketch, fed chunk by chunk
+# (sketches built on separate workers can be combined with .merge())
+sketch = QuantileSketch(k=200, seed=47)
+for start in range(0, len(df), 25):
+    sketch.update(df['Revenue'].iloc[start:start + 25])
+print(f"Sketch estimate of the 25th percentile: ₹{sketch.quantile(0.25):,.2f} "
+      f"({sketch.size()} values kept for {len(sketch)} rows)")
+
 # Scenario 4: Monthly best sellers
 df['Month'] = df['Date'].dt.to_period('M')
-monthly_best = df.groupby('Month').apply(
-    lambda x: x.nlargest(1, 'Revenue')[['Date', 'Product', 'Revenue']]
-)
+monthly_best = top_k_per_group(df, 'Month', 'Revenue', 1, group_keys=True)[['Date', 'Product', 'Revenue']]
 print("\nBest sale each month:")
 print(monthly_best)
 
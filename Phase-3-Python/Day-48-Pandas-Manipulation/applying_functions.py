@@ -5,6 +5,8 @@
 import pandas as pd
 import numpy as np
 
+from rule_engine import Rule, RuleSet, Tiers
+
 print("="*70)
 print("APPLYING FUNCTIONS IN PANDAS")
 print("="*70)
@@ -26,13 +28,16 @@ print("\n" + "="*70)
 print("PART 1: APPLY ON SERIES (SINGLE COLUMN)")
 print("="*70)
 
-# apply() with lambda function
 df['Revenue'] = df['Price'] * df['Quantity']
-df['Revenue_Category'] = df['Revenue'].apply(
-    lambda x: 'High' if x > 100000
-    else 'Medium' if x > 50000
-    else 'Low'
-)
+
+# Revenue band per order, written as a row-by-row function
+def revenue_category(x):
+    """Revenue band of one order"""
+    return 'High' if x > 100000 else 'Medium' if x > 50000 else 'Low'
+
+# Same if / elif ladder as data: one searchsorted over the whole column
+REVENUE_TIERS = Tiers('Revenue', [(100000, 'High'), (50000, 'Medium')], default='Low')
+df['Revenue_Category'] = REVENUE_TIERS.apply(df['Revenue'])
 print("Revenue Categories:")
 print(df[['Product', 'Revenue', 'Revenue_Category']])
 
@@ -48,7 +53,10 @@ def calculate_profit_margin(price):
     else:
         return 0.10   # 10% margin
 
-df['Profit_Margin'] = df['Price'].apply(calculate_profit_margin)
+# calculate_profit_margin as a tier table (thresholds in the same order as the ifs)
+PROFIT_MARGIN_TIERS = Tiers('Price', [(20000, 0.25), (5000, 0.20), (1000, 0.15)], default=0.10)
+
+df['Profit_Margin'] = PROFIT_MARGIN_TIERS.apply(df['Price'])
 df['Profit'] = df['Price'] * df['Profit_Margin'] * df['Quantity']
 
 print("\nWith Profit Margins:")
@@ -68,9 +76,24 @@ def classify_product(row):
     else:
         return 'Mid Range'
 
-df['Product_Classification'] = df.apply(classify_product, axis=1)
+# classify_product as ordered rules: first match wins, np.select instead of a call per row
+PRODUCT_RULES = RuleSet([
+    Rule('premium_low_volume', [('Price', '>', 10000), ('Quantity', '<', 50)], 'Premium Low Volume'),
+    Rule('budget_high_volume', [('Price', '<', 2000), ('Quantity', '>', 50)], 'Budget High Volume'),
+], default='Mid Range')
+
+df['Product_Classification'] = PRODUCT_RULES.apply(df)
+df['Rule_Fired'] = PRODUCT_RULES.explain(df)  # which rule decided each row
 print("Product Classification:")
-print(df[['Product', 'Price', 'Quantity', 'Product_Classification']])
+print(df[['Product', 'Price', 'Quantity', 'Product_Classification', 'Rule_Fired']])
+print("\nProfit margin tier per product:")
+print(pd.DataFrame({'Product': df['Product'], 'Tier': PROFIT_MARGIN_TIERS.explain(df['Price'])}))
+
+# Same answers as the row-by-row functions they replace
+print("\nMatches the apply() versions:",
+      df['Revenue_Category'].equals(df['Revenue'].apply(revenue_category))
+      and df['Profit_Margin'].equals(df['Price'].apply(calculate_profit_margin))
+      and df['Product_Classification'].equals(df.apply(classify_product, axis=1)))
 
 print("\n" + "="*70)
 print("PART 3: MAP FUNCTION (VALUE REPLACEMENT)")
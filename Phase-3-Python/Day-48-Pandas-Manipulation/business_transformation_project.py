@@ -5,6 +5,10 @@
 import pandas as pd
 import numpy as np
 
+from calendar_features import add_calendar_features
+from text_normalizer import TextNormalizer
+from type_inference import optimize_dtypes
+
 print("="*70)
 print("BUSINESS DATA TRANSFORMATION PROJECT")
 print("Scenario: E-commerce Raw Data → Analytics-Ready Dataset")
@@ -56,17 +60,20 @@ print("="*70)
 df = df_raw.copy()
 
 # 1. Standardize text columns
-df['customer_name'] = df['customer_name'].str.title()
-df['product'] = df['product'].str.title()
-df['region'] = df['region'].str.title()
+# (title-cases each distinct value once, not every row; result is categorical
+#  and the raw -> clean mapping is cached on disk for the next run)
+normalizer = TextNormalizer(str.title)
+normalizer.normalize_columns(df, ['customer_name', 'product', 'region'])
 
 print("✅ Text standardized (Title Case)")
+print(f"   Distinct values transformed: {normalizer.misses} | from cache: {normalizer.hits}")
 
-# 2. Convert data types
-df['order_date'] = pd.to_datetime(df['order_date'])
-df['unit_price'] = pd.to_numeric(df['unit_price'])
+# 2. Convert data types (inferred: order_date -> datetime64, unit_price -> smallest int)
+df, memory = optimize_dtypes(df, columns=['order_date', 'unit_price'])
 
 print("✅ Data types converted")
+print(f"   Table memory: {memory.loc['TOTAL', 'bytes_before']:,} → "
+      f"{memory.loc['TOTAL', 'bytes_after']:,} bytes")
 
 # 3. Handle missing values
 df['payment_method'] = df['payment_method'].fillna('Unknown')
@@ -87,13 +94,15 @@ df['gross_revenue'] = df['quantity'] * df['unit_price']
 df['discount_amount'] = df['gross_revenue'] * (df['discount_pct'] / 100)
 df['net_revenue'] = df['gross_revenue'] - df['discount_amount']
 
-# Datetime features
-df['year'] = df['order_date'].dt.year
-df['month'] = df['order_date'].dt.month
-df['month_name'] = df['order_date'].dt.month_name()
-df['day_of_week'] = df['order_date'].dt.day_name()
-df['week_number'] = df['order_date'].dt.isocalendar().week
-df['is_weekend'] = df['order_date'].dt.dayofweek >= 5
+# Datetime features (computed once per distinct day, names as category)
+add_calendar_features(df, 'order_date', {
+    'year': 'year',
+    'month': 'month',
+    'month_name': 'month_name',
+    'day_of_week': 'day_name',
+    'week_number': 'week',
+    'is_weekend': 'is_weekend',
+})
 
 # Customer segments
 df['customer_segment'] = df['net_revenue'].apply(
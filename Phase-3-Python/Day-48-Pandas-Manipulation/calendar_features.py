@@ -0,0 +1,91 @@
+# Day 48 - Calendar Features
+# Year / month / day name / ISO week ... computed once per calendar day, not once per row
+
+import numpy as np
+import pandas as pd
+
+# feature -> how to compute it from a Series of days (via .dt)
+FEATURES = {
+    'year': lambda days: days.dt.year,
+    'month': lambda days: days.dt.month,
+    'month_name': lambda days: days.dt.month_name().astype('category'),
+    'day': lambda days: days.dt.day,
+    'day_name': lambda days: days.dt.day_name().astype('category'),
+    'week': lambda days: days.dt.isocalendar().week,
+    'quarter': lambda days: days.dt.quarter,
+    'dayofweek': lambda days: days.dt.dayofweek,
+    'is_weekend': lambda days: days.dt.dayofweek >= 5,
+}
+
+
+def calendar_table(start, end):
+    """One row per day from start to end (inclusive) with every feature in FEATURES"""
+    days = pd.Series(pd.date_range(start, end, freq='D'))
+    return pd.DataFrame({name: compute(days) for name, compute in FEATURES.items()})
+
+
+def _day_offsets(dates):
+    """
+    Calendar table covering the dates + the row of that table for each date
+    Short spans get a dense table indexed by day offset from the first date;
+    very long, sparse spans fall back to one row per distinct date.
+    """
+    if isinstance(dates.dtype, pd.DatetimeTZDtype):
+        # Local wall time, the day .dt sees (to_numpy would convert to UTC)
+        dates = dates.dt.tz_localize(None)
+    days = dates.to_numpy(dtype='datetime64[ns]').astype('datetime64[D]')
+    missing = np.isnat(days)
+    present = days[~missing]
+    if len(present) == 0:
+        unique_days = present
+        rows = np.zeros(len(days), dtype=np.int64)
+    elif (present.max() - present.min()).astype(np.int64) <= len(present) + 366:
+        first = present.min()
+        unique_days = np.arange(first, present.max() + 1)
+        rows = (days - first).astype(np.int64)
+    else:
+        unique_days, inverse = np.unique(present, return_inverse=True)
+        rows = np.zeros(len(days), dtype=np.int64)
+        rows[~missing] = inverse
+    table_days = pd.Series(unique_days.astype('datetime64[ns]'))
+    if missing.any():
+        # NaT gets its own last row, so its features come out missing as with .dt
+        table_days = pd.concat([table_days, pd.Series([pd.NaT], dtype='datetime64[ns]')],
+                               ignore_index=True)
+        rows[missing] = len(table_days) - 1
+    return table_days, rows
+
+
+def calendar_features(dates, features=None):
+    """
+    Calendar features for a datetime Series, same values as the .dt accessors
+    (month_name / day_name as category). Each feature is computed on the
+    distinct days only, then looked up by integer day offset.
+    features: list of FEATURES keys, or {output column: feature} (default: all)
+    """
+    if features is None:
+        features = list(FEATURES)
+    if not isinstance(features, dict):
+        features = {name: name for name in features}
+    unknown = [feature for feature in features.values() if feature not in FEATURES]
+    if unknown:
+        raise KeyError(f"Unknown calendar features: {unknown}")
+
+    dates = pd.Series(dates)
+    table_days, rows = _day_offsets(dates)
+    columns = {}
+    for column, feature in features.items():
+        values = FEATURES[feature](table_days).take(rows)
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            # Only names that occur (the table may span days that are not in the data)
+            values = values.cat.remove_unused_categories()
+        values.index = dates.index
+        columns[column] = values
+    return pd.DataFrame(columns)
+
+
+def add_calendar_features(df, date_column, features=None):
+    """Add calendar feature columns to df (in place) from one datetime column"""
+    for column, values in calendar_features(df[date_column], features).items():
+        df[column] = values
+    return df
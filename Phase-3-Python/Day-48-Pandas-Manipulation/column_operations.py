@@ -5,6 +5,8 @@
 import pandas as pd
 import numpy as np
 
+from column_pipeline import ColumnPipeline
+
 print("="*70)
 print("COLUMN OPERATIONS IN PANDAS")
 print("="*70)
@@ -84,10 +86,11 @@ print("\n" + "="*70)
 print("PART 3: DELETING COLUMNS & ROWS")
 print("="*70)
 
-df_copy = df.copy()
+# drop() / rename() return new frames and never modify df (copy-on-write),
+# so no defensive df.copy() is needed first
 
 # Drop single column
-df_copy = df_copy.drop('Company', axis=1)
+df_copy = df.drop('Company', axis=1)
 print("After dropping 'Company' column:")
 print(df_copy.columns.tolist())
 
@@ -110,10 +113,8 @@ print("\n" + "="*70)
 print("PART 4: COLUMN RENAMING")
 print("="*70)
 
-df_rename = df.copy()
-
 # Rename specific columns
-df_rename = df_rename.rename(columns={
+df_rename = df.rename(columns={
     'Employee': 'Employee_Name',
     'Base_Salary': 'Monthly_Salary',
     'Performance_Score': 'Score'
@@ -131,6 +132,32 @@ df_rename.columns = df_rename.columns.str.replace(' ', '_')
 print("\nSpaces replaced with underscores:")
 print(df_rename.columns.tolist())
 
+print("\n" + "="*70)
+print("PART 5: LAZY PIPELINE (ALL STEPS IN ONE PASS)")
+print("="*70)
+
+# Record the Part 1 / 3 / 4 column steps, then run them together on the
+# original data: numpy arrays in between, one DataFrame built at the end
+pipeline = (
+    ColumnPipeline()
+    .constant('Company', 'TechCorp India')
+    .derive('Annual_Salary', lambda Base_Salary: Base_Salary * 12)
+    .derive('Performance_Grade', lambda Performance_Score: np.where(
+        Performance_Score >= 90, 'A', np.where(Performance_Score >= 80, 'B', 'C')))
+    .derive('Bonus', lambda Base_Salary: Base_Salary * 0.10)
+    .derive('Total_Compensation', lambda Base_Salary, Bonus: Base_Salary + Bonus)
+    .drop('Company')
+    .rename({'Employee': 'Employee_Name', 'Base_Salary': 'Monthly_Salary', 'Performance_Score': 'Score'})
+)
+print("Recorded steps:")
+for line in pipeline.describe():
+    print(f"  - {line}")
+
+df_pipeline = pipeline.run(pd.DataFrame(data))
+print("\nPipeline result:")
+print(df_pipeline.to_string())
+print(f"\nPeak memory of the run: {pipeline.peak_memory:,} bytes ({pipeline.seconds * 1000:.2f} ms)")
+
 print("\n" + "="*70)
 print("COLUMN OPERATIONS COMPLETE ✅")
 print("="*70)
\ No newline at end of file
@@ -0,0 +1,127 @@
+# Day 48 - Lazy Column Pipeline
+# Record derived columns, drops and renames; build the result frame once
+
+import inspect
+import time
+import tracemalloc
+
+import pandas as pd
+
+
+class _Source:
+    """Placeholder for a column of the input frame (read only when needed, never copied)"""
+
+    def __init__(self, name):
+        self.name = name
+
+
+class _Constant:
+    def __init__(self, value):
+        self.value = value
+
+
+class ColumnPipeline:
+    """
+    Column steps recorded now, executed later in one pass
+        pipeline = (ColumnPipeline()
+                    .derive('Annual_Salary', lambda Base_Salary: Base_Salary * 12)
+                    .drop('Company')
+                    .rename({'Employee': 'Employee_Name'}))
+        result = pipeline.run(df)
+    derive() reads its inputs from the function's parameter names (or inputs=[...]),
+    which get numpy arrays. run() evaluates the steps in order on arrays, then
+    builds exactly one DataFrame; no intermediate frames and no copies of
+    untouched columns. Peak traced memory of the last run: pipeline.peak_memory
+    """
+
+    def __init__(self):
+        self.steps = []
+        self.peak_memory = None
+        self.seconds = None
+
+    def derive(self, name, func, inputs=None):
+        """New (or replaced) column = func(*input columns)"""
+        if inputs is None:
+            inputs = list(inspect.signature(func).parameters)
+        self.steps.append(('derive', name, func, list(inputs)))
+        return self
+
+    def constant(self, name, value):
+        """Column with the same value in every row (broadcast when the frame is built)"""
+        self.steps.append(('constant', name, value))
+        return self
+
+    def drop(self, *names):
+        self.steps.append(('drop', names))
+        return self
+
+    def rename(self, mapping):
+        self.steps.append(('rename', dict(mapping)))
+        return self
+
+    def describe(self):
+        """Recorded steps, one line each"""
+        lines = []
+        for step in self.steps:
+            if step[0] == 'derive':
+                lines.append(f"derive {step[1]} from {', '.join(step[3])}")
+            elif step[0] == 'constant':
+                lines.append(f"constant {step[1]} = {step[2]!r}")
+            elif step[0] == 'drop':
+                lines.append(f"drop {', '.join(step[1])}")
+            else:
+                lines.append("rename " + ', '.join(f"{k} -> {v}" for k, v in step[1].items()))
+        return lines
+
+    @staticmethod
+    def _value(df, column):
+        if isinstance(column, _Source):
+            return df[column.name].to_numpy()
+        if isinstance(column, _Constant):
+            return column.value
+        return column
+
+    def _execute(self, df):
+        columns = {name: _Source(name) for name in df.columns}
+        for step in self.steps:
+            kind = step[0]
+            if kind == 'derive':
+                _, name, func, inputs = step
+                missing = [column for column in inputs if column not in columns]
+                if missing:
+                    raise KeyError(f"{name}: unknown input columns {missing}")
+                columns[name] = func(*[self._value(df, columns[column]) for column in inputs])
+            elif kind == 'constant':
+                columns[step[1]] = _Constant(step[2])
+            elif kind == 'drop':
+                for name in step[1]:
+                    del columns[name]   # a dropped derived column is freed right here
+            else:
+                columns = {step[1].get(name, name): column for name, column in columns.items()}
+
+        data = {}
+        for name, column in columns.items():
+            if isinstance(column, _Source):
+                data[name] = df[column.name]
+            elif isinstance(column, _Constant):
+                data[name] = column.value
+            else:
+                data[name] = column
+        return pd.DataFrame(data, index=df.index, copy=False)
+
+    def run(self, df):
+        """Execute every recorded step on df and return the resulting frame"""
+        started_tracing = not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        baseline = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        try:
+            result = self._execute(df)
+        finally:
+            self.seconds = time.perf_counter() - start
+            self.peak_memory = tracemalloc.get_traced_memory()[1] - baseline
+            if started_tracing:
+                tracemalloc.stop()
+        return result
@@ -5,6 +5,9 @@
 import pandas as pd
 import numpy as np
 
+from calendar_features import add_calendar_features
+from type_inference import optimize_dtypes
+
 print("="*70)
 print("DATA TYPES AND DATETIME OPERATIONS")
 print("="*70)
@@ -47,6 +50,12 @@ print("\nCategory_Code as category type:")
 print(df['Category_Code'])
 print(f"Categories: {df['Category_Code'].cat.categories.tolist()}")
 
+# All of the above in one step: sample each raw column, pick the narrowest
+# dtype (int8/16/32, float32, bool, category, datetime64) and convert in bulk
+auto_df, memory = optimize_dtypes(pd.DataFrame(raw_data))
+print("\nAutomatic type inference on the raw data:")
+print(memory.to_string())
+
 print("\n" + "="*70)
 print("PART 2: DATETIME OPERATIONS")
 print("="*70)
@@ -66,14 +75,18 @@ print("\nDatetime-rich dataset:")
 print(date_data.head())
 
 # Extract datetime components
-date_data['Year'] = date_data['Date'].dt.year
-date_data['Month'] = date_data['Date'].dt.month
-date_data['Month_Name'] = date_data['Date'].dt.month_name()
-date_data['Day'] = date_data['Date'].dt.day
-date_data['Day_Name'] = date_data['Date'].dt.day_name()
-date_data['Week'] = date_data['Date'].dt.isocalendar().week
-date_data['Quarter'] = date_data['Date'].dt.quarter
-date_data['Is_Weekend'] = date_data['Date'].dt.dayofweek >= 5
+# (same values as .dt.year / .dt.month_name() / ..., but computed once per
+#  distinct day and joined back; month and day names come back as category)
+add_calendar_features(date_data, 'Date', {
+    'Year': 'year',
+    'Month': 'month',
+    'Month_Name': 'month_name',
+    'Day': 'day',
+    'Day_Name': 'day_name',
+    'Week': 'week',
+    'Quarter': 'quarter',
+    'Is_Weekend': 'is_weekend',
+})
 
 print("\nWith extracted datetime features:")
 print(date_data.head(10))
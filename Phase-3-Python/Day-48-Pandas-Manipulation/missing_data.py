@@ -5,6 +5,9 @@
 import pandas as pd
 import numpy as np
 
+from null_profile import NullProfile
+from streaming_imputer import StreamingImputer
+
 print("="*70)
 print("HANDLING MISSING DATA IN PANDAS")
 print("="*70)
@@ -27,51 +30,61 @@ print("\n" + "="*70)
 print("PART 1: DETECTING MISSING VALUES")
 print("="*70)
 
+# Scan for missing values once; everything below is read from the packed bitmap
+# (same numbers as df.isnull().sum(), .any(axis=1), dropna(...), without rescanning)
+profile = NullProfile(df)
+
 # Check for missing values
 print("Missing values per column:")
-print(df.isnull().sum())
+print(profile.column_counts())
 
 # Percentage of missing values
 print("\nMissing value percentage:")
-missing_pct = (df.isnull().sum() / len(df) * 100).round(2)
+missing_pct = profile.column_pct()
 print(missing_pct)
 
 # Total missing values
-print(f"\nTotal missing values: {df.isnull().sum().sum()}")
+print(f"\nTotal missing values: {profile.total()}")
 print(f"Total cells: {df.size}")
-print(f"Missing percentage: {(df.isnull().sum().sum() / df.size * 100):.2f}%")
+print(f"Missing percentage: {(profile.total() / df.size * 100):.2f}%")
 
 # Check if any value in a row is missing
-df['Has_Missing'] = df.isnull().any(axis=1)
+df['Has_Missing'] = profile.row_any()
 print("\nRows with missing values:")
 print(df[df['Has_Missing'] == True][['Customer_ID', 'Name', 'Has_Missing']])
 
 # Drop the helper column
 df = df.drop('Has_Missing', axis=1)
 
+# Which columns go missing together, and the most common missing patterns per row
+print("\nRows where both columns are missing:")
+print(profile.co_missing())
+print("\nMissing-value patterns:")
+print(profile.patterns().to_string(index=False))
+
 print("\n" + "="*70)
 print("PART 2: REMOVING MISSING VALUES")
 print("="*70)
 
 df_clean = df.copy()
 
-# Drop rows with ANY missing value
-df_no_missing = df_clean.dropna()
+# Drop rows with ANY missing value (same rows as df_clean.dropna())
+df_no_missing = df_clean[profile.rows_kept()]
 print(f"Original rows: {len(df_clean)}")
 print(f"After dropping ANY missing: {len(df_no_missing)} rows")
 
 # Drop rows where ALL values are missing
-df_not_all_missing = df_clean.dropna(how='all')
+df_not_all_missing = df_clean[profile.rows_kept(how='all')]
 print(f"After dropping ALL missing: {len(df_not_all_missing)} rows")
 
 # Drop rows where specific columns have missing values
-df_required_cols = df_clean.dropna(subset=['Name', 'Purchase_Amount'])
+df_required_cols = df_clean[profile.rows_kept(subset=['Name', 'Purchase_Amount'])]
 print(f"After dropping missing Name/Purchase: {len(df_required_cols)} rows")
 print(df_required_cols)
 
 # Drop columns with too many missing values (> 30%)
 threshold = len(df_clean) * 0.7
-df_dropped_cols = df_clean.dropna(axis=1, thresh=threshold)
+df_dropped_cols = df_clean.drop(columns=profile.columns_below(threshold))  # == dropna(axis=1, thresh=...)
 print(f"\nColumns after dropping high-missing columns:")
 print(df_dropped_cols.columns.tolist())
 
@@ -117,6 +130,38 @@ print(sample['Sales'].ffill())
 print("\nBackward fill (use next value):")
 print(sample['Sales'].bfill())
 
+print("\n" + "="*70)
+print("PART 3B: SAME FILLS, CHUNK BY CHUNK (FOR TABLES TOO BIG FOR MEMORY)")
+print("="*70)
+
+# Pass 1 collects mergeable statistics per chunk (sum/count, value histogram, mode counts),
+# pass 2 fills each chunk in place; no full copy of the table is ever made
+imputer = StreamingImputer({
+    'Name': ('constant', 'Unknown'),
+    'City': ('constant', 'Not Specified'),
+    'Age': 'mean',
+    'Purchase_Amount': 'median',
+    'Loyalty_Score': 'mode',
+})
+chunk_size = 3
+for start in range(0, len(df), chunk_size):
+    imputer.fit_chunk(df.iloc[start:start + chunk_size])
+print("Fill values from pass 1:", imputer.fill_values())
+
+filled_chunks = [imputer.transform_chunk(df.iloc[start:start + chunk_size].copy())
+                 for start in range(0, len(df), chunk_size)]
+df_stream = pd.concat(filled_chunks)
+df_stream['Age'] = df_stream['Age'].round(0)
+print("Matches the in-memory fills:", df_stream.equals(df_fill))
+
+# ffill / bfill carry values across chunk boundaries
+series_imputer = StreamingImputer({'Sales': 'ffill'})
+sales_chunks = [sample.iloc[start:start + 2] for start in range(0, len(sample), 2)]
+for chunk in sales_chunks:
+    series_imputer.fit_chunk(chunk)
+stream_ffill = pd.concat([series_imputer.transform_chunk(chunk.copy()) for chunk in sales_chunks])
+print("Chunked forward fill matches ffill():", stream_ffill['Sales'].equals(sample['Sales'].ffill()))
+
 print("\n" + "="*70)
 print("PART 4: STRATEGY DECISION")
 print("="*70)
@@ -0,0 +1,118 @@
+# Day 48 - Missing-Value Profile
+# One isna() scan packed into bits; every missing-value question answered from the bits
+
+import numpy as np
+import pandas as pd
+
+# Number of set bits in each possible byte
+POPCOUNT = np.array([bin(i).count('1') for i in range(256)], dtype=np.uint8)
+
+
+class NullProfile:
+    """
+    Missing-value bitmap of a DataFrame: one bit per cell, 1 = missing
+    (8x smaller than a boolean isnull() frame). Built with a single scan of
+    each column; counts, row any/all, co-missingness and dropna decisions
+    all come from the packed bits without touching the data again.
+    """
+
+    def __init__(self, df):
+        self.columns = df.columns
+        self.index = df.index
+        self.n_rows = len(df)
+        bytes_per_column = (self.n_rows + 7) // 8
+        self.bits = np.zeros((len(df.columns), bytes_per_column), dtype=np.uint8)
+        for i, column in enumerate(df.columns):
+            self.bits[i] = np.packbits(df[column].isna().to_numpy())
+
+    def _unpack(self, packed):
+        """Packed row bits -> boolean array of length n_rows"""
+        return np.unpackbits(packed, count=self.n_rows, axis=-1).astype(bool)
+
+    def nbytes(self):
+        return self.bits.nbytes
+
+    # --- per column -------------------------------------------------------
+
+    def column_counts(self):
+        """Missing values per column, like df.isnull().sum()"""
+        counts = POPCOUNT[self.bits].sum(axis=1, dtype=np.int64)
+        return pd.Series(counts, index=self.columns)
+
+    def column_pct(self, decimals=2):
+        """Percentage missing per column"""
+        return (self.column_counts() / self.n_rows * 100).round(decimals)
+
+    def total(self):
+        """Missing cells in the whole frame, like df.isnull().sum().sum()"""
+        return int(self.column_counts().sum())
+
+    def columns_below(self, thresh):
+        """Columns with fewer than `thresh` non-missing values: what dropna(axis=1, thresh=thresh) drops"""
+        present = self.n_rows - self.column_counts()
+        return list(present.index[present < thresh])
+
+    # --- per row ----------------------------------------------------------
+
+    def row_any(self):
+        """Rows with at least one missing value, like df.isnull().any(axis=1)"""
+        return pd.Series(self._unpack(np.bitwise_or.reduce(self.bits, axis=0)), index=self.index)
+
+    def row_all(self):
+        """Rows where every value is missing, like df.isnull().all(axis=1)"""
+        if len(self.columns) == 0:
+            return pd.Series(True, index=self.index)
+        return pd.Series(self._unpack(np.bitwise_and.reduce(self.bits, axis=0)), index=self.index)
+
+    def row_counts(self):
+        """Missing values per row"""
+        return pd.Series(self._unpack(self.bits).sum(axis=0), index=self.index)
+
+    def rows_kept(self, how='any', thresh=None, subset=None):
+        """
+        Boolean row mask of what df.dropna(how=..., thresh=..., subset=...) keeps
+        """
+        profile = self if subset is None else self.subset(subset)
+        if thresh is not None:
+            return len(profile.columns) - profile.row_counts() >= thresh
+        return ~(profile.row_any() if how == 'any' else profile.row_all())
+
+    def subset(self, columns):
+        """Profile restricted to some columns (no rescan)"""
+        positions = self.columns.get_indexer(columns)
+        if (positions < 0).any():
+            # Same error as df.dropna(subset=...) with an unknown column
+            raise KeyError([column for column, position in zip(columns, positions) if position < 0])
+        sub = NullProfile.__new__(NullProfile)
+        sub.columns = self.columns[positions]
+        sub.index = self.index
+        sub.n_rows = self.n_rows
+        sub.bits = self.bits[positions]
+        return sub
+
+    # --- co-missingness ---------------------------------------------------
+
+    def co_missing(self):
+        """Rows where both columns are missing, for every pair of columns (diagonal = column counts)"""
+        k = len(self.columns)
+        counts = np.zeros((k, k), dtype=np.int64)
+        for i in range(k):
+            counts[i, i:] = POPCOUNT[self.bits[i] & self.bits[i:]].sum(axis=1, dtype=np.int64)
+            counts[i:, i] = counts[i, i:]
+        return pd.DataFrame(counts, index=self.columns, columns=self.columns)
+
+    def patterns(self):
+        """
+        How often each combination of missing columns occurs in a row
+        (most common first; rows with nothing missing show as '(none)')
+        """
+        # One byte string per row: the row's missing flags across columns
+        per_row = np.packbits(self._unpack(self.bits), axis=0).T
+        keys, counts = np.unique(per_row, axis=0, return_counts=True)
+        flags = np.unpackbits(keys, axis=1, count=len(self.columns)).astype(bool)
+        result = pd.DataFrame({
+            'missing_columns': [', '.join(self.columns[row].astype(str)) or '(none)' for row in flags],
+            'n_missing': flags.sum(axis=1),
+            'rows': counts,
+        })
+        return result.sort_values(['rows', 'n_missing'], ascending=[False, True], ignore_index=True)
@@ -0,0 +1,121 @@
+# Day 48 - Rule Engine
+# if / elif classifiers written as data, run as whole-column numpy operations
+
+import operator
+
+import numpy as np
+import pandas as pd
+
+OPERATORS = {
+    '==': operator.eq, '!=': operator.ne,
+    '>': operator.gt, '>=': operator.ge,
+    '<': operator.lt, '<=': operator.le,
+}
+DEFAULT = 'default'
+
+
+def _output_array(outputs):
+    """
+    Outputs as an array to index by rule position; text stays as Python str
+    objects, which pandas turns into a str column much faster than numpy '<U'
+    """
+    outputs = np.array(outputs)
+    return outputs.astype(object) if outputs.dtype.kind == 'U' else outputs
+
+
+def _fired_series(codes, names, index):
+    """Which rule fired per row, as a categorical (1 byte per row, not a string)"""
+    return pd.Series(pd.Categorical.from_codes(codes, categories=names), index=index)
+
+
+class Rule:
+    """
+    One branch of an if / elif chain
+    conditions: list of (column, op, value), all must hold (AND),
+                or a function df -> boolean mask for anything else
+    """
+
+    def __init__(self, name, conditions, output):
+        self.name = name
+        self.conditions = conditions
+        self.output = output
+
+    def mask(self, df):
+        if callable(self.conditions):
+            return np.asarray(self.conditions(df), dtype=bool)
+        mask = np.ones(len(df), dtype=bool)
+        for column, op, value in self.conditions:
+            mask &= np.asarray(OPERATORS[op](df[column].to_numpy(), value), dtype=bool)
+        return mask
+
+    def __repr__(self):
+        return f"Rule({self.name!r} -> {self.output!r})"
+
+
+class RuleSet:
+    """
+    Ordered rules + default, like
+        if rule1: out1 / elif rule2: out2 / ... / else: default
+    The first rule that holds wins (np.select over all rule masks).
+    """
+
+    def __init__(self, rules, default):
+        self.rules = list(rules)
+        self.default = default
+        self.names = [rule.name for rule in self.rules] + [DEFAULT]
+        self.outputs = _output_array([rule.output for rule in self.rules] + [default])
+
+    def fired(self, df):
+        """Position of the rule that fired per row (len(rules) = default)"""
+        return np.select([rule.mask(df) for rule in self.rules],
+                         np.arange(len(self.rules)), default=len(self.rules))
+
+    def apply(self, df):
+        """Output column, same values as df.apply(classifier, axis=1)"""
+        return pd.Series(self.outputs[self.fired(df)], index=df.index)
+
+    def explain(self, df):
+        """Name of the rule that fired for each row"""
+        return _fired_series(self.fired(df), self.names, df.index)
+
+
+class Tiers:
+    """
+    Threshold ladder on one column, like
+        if x > t1: out1 / elif x > t2: out2 / ... / else: default
+    with t1 > t2 > ... Compiled to one np.searchsorted call.
+    tiers: [(threshold, output), ...] in the same (descending) order as the if chain
+    """
+
+    def __init__(self, column, tiers, default):
+        thresholds = [threshold for threshold, _ in tiers]
+        if any(a <= b for a, b in zip(thresholds, thresholds[1:])):
+            raise ValueError("Tier thresholds must be strictly descending, like the if / elif chain")
+        self.column = column
+        self.tiers = list(tiers)
+        self.default = default
+        # Ascending for searchsorted: position = how many thresholds x is above
+        self.thresholds = np.array(thresholds[::-1])
+        self.outputs = _output_array([default] + [output for _, output in tiers[::-1]])
+        self.names = [DEFAULT] + [f"{column} > {threshold}" for threshold, _ in tiers[::-1]]
+
+    def fired(self, values):
+        """Tier position per value (0 = default, k = above the k lowest thresholds)"""
+        if isinstance(values, pd.DataFrame):
+            values = values[self.column]
+        values = np.asarray(values)
+        positions = np.searchsorted(self.thresholds, values, side='left')
+        if values.dtype.kind == 'f':
+            # NaN > t is False for every t: falls through to the default, as in the if chain
+            positions[np.isnan(values)] = 0
+        return positions
+
+    def apply(self, values):
+        """Output for a Series (or the tier column of a DataFrame)"""
+        index = values.index if hasattr(values, 'index') else None
+        return pd.Series(self.outputs[self.fired(values)], index=index)
+
+    def explain(self, values):
+        """Name of the tier that fired for each value"""
+        index = values.index if hasattr(values, 'index') else None
+        return _fired_series(self.fired(values), self.names, index)
@@ -0,0 +1,193 @@
+# Day 48 - Streaming Imputation
+# mean / median / mode / constant / ffill / bfill filling, chunk by chunk in two passes
+
+import numpy as np
+
+# Distinct values kept per median column before neighbouring values are merged
+# (median is exact below this, approximate above)
+MAX_BINS = 65_536
+STRATEGIES = ('mean', 'median', 'mode', 'constant', 'ffill', 'bfill')
+
+
+class ValueHistogram:
+    """Sorted distinct values with counts; mergeable, bounded to max_bins entries"""
+
+    def __init__(self, max_bins=MAX_BINS):
+        self.max_bins = max_bins
+        self.values = np.empty(0)
+        self.counts = np.empty(0, dtype=np.int64)
+        self.exact = True
+
+    def _combine(self, values, counts):
+        values = np.concatenate([self.values, values])
+        counts = np.concatenate([self.counts, counts])
+        self.values, inverse = np.unique(values, return_inverse=True)
+        self.counts = np.bincount(inverse, weights=counts, minlength=len(self.values)).astype(np.int64)
+        while len(self.values) > self.max_bins:
+            # Merge neighbours pairwise into their weighted mean
+            size = len(self.values) - len(self.values) % 2
+            pair_counts = self.counts[:size:2] + self.counts[1:size:2]
+            pair_values = (self.values[:size:2] * self.counts[:size:2]
+                           + self.values[1:size:2] * self.counts[1:size:2]) / pair_counts
+            self.values = np.concatenate([pair_values, self.values[size:]])
+            self.counts = np.concatenate([pair_counts, self.counts[size:]])
+            self.exact = False
+
+    def add(self, values):
+        values, counts = np.unique(values, return_counts=True)
+        self._combine(values, counts)
+
+    def merge(self, other):
+        self._combine(other.values, other.counts)
+        self.exact = self.exact and other.exact
+
+    def median(self):
+        """Same rule as Series.median(): middle value, or mean of the two middle values"""
+        n = self.counts.sum()
+        if n == 0:
+            return np.nan
+        cumulative = np.cumsum(self.counts)
+        lower = self.values[np.searchsorted(cumulative, (n - 1) // 2, side='right')]
+        upper = self.values[np.searchsorted(cumulative, n // 2, side='right')]
+        return float((lower + upper) / 2 if n % 2 == 0 else lower)
+
+
+class ColumnState:
+    """Pass-one statistics for one column"""
+
+    def __init__(self, strategy, max_bins=MAX_BINS):
+        self.strategy = strategy
+        self.count = 0
+        self.total = 0.0
+        self.histogram = ValueHistogram(max_bins) if strategy == 'median' else None
+        self.value_counts = {} if strategy == 'mode' else None
+        # First / last non-missing value of every chunk, for ffill / bfill carry
+        self.first_valid = []
+        self.last_valid = []
+
+    def update(self, series):
+        valid = series.dropna()
+        self.first_valid.append(valid.iloc[0] if len(valid) else None)
+        self.last_valid.append(valid.iloc[-1] if len(valid) else None)
+        if self.strategy == 'mean':
+            self.count += len(valid)
+            self.total += float(valid.sum())
+        elif self.strategy == 'median':
+            self.histogram.add(valid.to_numpy(dtype=np.float64))
+        elif self.strategy == 'mode':
+            for value, count in valid.value_counts(sort=False).items():
+                self.value_counts[value] = self.value_counts.get(value, 0) + count
+
+    def merge(self, other):
+        """Fold in the state of the chunks that follow (e.g. another worker's share)"""
+        self.count += other.count
+        self.total += other.total
+        if self.histogram is not None:
+            self.histogram.merge(other.histogram)
+        if self.value_counts is not None:
+            for value, count in other.value_counts.items():
+                self.value_counts[value] = self.value_counts.get(value, 0) + count
+        self.first_valid += other.first_valid
+        self.last_valid += other.last_valid
+
+    def fill_value(self, constant=None):
+        if self.strategy == 'mean':
+            return self.total / self.count if self.count else np.nan
+        if self.strategy == 'median':
+            return self.histogram.median()
+        if self.strategy == 'mode':
+            # Most frequent; ties go to the smallest value, like Series.mode()[0]
+            if not self.value_counts:
+                return np.nan
+            best = max(self.value_counts.values())
+            return min(value for value, count in self.value_counts.items() if count == best)
+        return constant
+
+
+class StreamingImputer:
+    """
+    Two-pass imputation over a table that arrives in chunks
+    strategies: {column: 'mean' | 'median' | 'mode' | 'ffill' | 'bfill' | ('constant', value)}
+    Pass one: fit_chunk() on every chunk (in order) collects mergeable statistics
+    Pass two: transform_chunk() on the same chunks fills them; ffill / bfill
+    continue across chunk boundaries using the values recorded in pass one
+    """
+
+    def __init__(self, strategies, max_bins=MAX_BINS):
+        self.strategies = {}
+        self.constants = {}
+        for column, strategy in strategies.items():
+            if isinstance(strategy, tuple):
+                strategy, self.constants[column] = strategy
+            if strategy not in STRATEGIES:
+                raise ValueError(f"Unknown strategy for {column!r}: {strategy!r}")
+            self.strategies[column] = strategy
+        self.states = {column: ColumnState(strategy, max_bins)
+                       for column, strategy in self.strategies.items()}
+        self.chunks_fitted = 0
+        self._chunks_filled = 0
+        self._fill_values = None
+
+    def fit_chunk(self, chunk):
+        """Pass one: accumulate statistics from one chunk"""
+        for column, state in self.states.items():
+            state.update(chunk[column])
+        self.chunks_fitted += 1
+        self._fill_values = None
+        return self
+
+    def merge(self, other):
+        """Combine with an imputer fitted on the chunks that come after this one's"""
+        for column, state in self.states.items():
+            state.merge(other.states[column])
+        self.chunks_fitted += other.chunks_fitted
+        self._fill_values = None
+        return self
+
+    def fill_values(self):
+        """Fill value per mean / median / mode / constant column (ffill / bfill columns have none)"""
+        if self._fill_values is None:
+            self._fill_values = {column: state.fill_value(self.constants.get(column))
+                                 for column, state in self.states.items()
+                                 if state.strategy not in ('ffill', 'bfill')}
+        return self._fill_values
+
+    def _carry(self, column, chunk_id):
+        """Value a ffill / bfill entering chunk `chunk_id` brings from the neighbouring chunks"""
+        state = self.states[column]
+        if state.strategy == 'ffill':
+            earlier = [v for v in state.last_valid[:chunk_id] if v is not None]
+            return earlier[-1] if earlier else None
+        later = [v for v in state.first_valid[chunk_id + 1:] if v is not None]
+        return later[0] if later else None
+
+    def transform_chunk(self, chunk, chunk_id=None):
+        """
+        Pass two: fill one chunk in place and return it
+        chunk_id: position of the chunk in pass one (default: the next one)
+        """
+        if chunk_id is None:
+            chunk_id = self._chunks_filled
+        self._chunks_filled = chunk_id + 1
+        values = self.fill_values()
+        for column, strategy in self.strategies.items():
+            if strategy in ('ffill', 'bfill'):
+                filled = chunk[column].ffill() if strategy == 'ffill' else chunk[column].bfill()
+                carry = self._carry(column, chunk_id)
+                chunk[column] = filled if carry is None else filled.fillna(carry)
+            else:
+                chunk[column] = chunk[column].fillna(values[column])
+        return chunk
+
+
+def impute_stream(read_chunks, strategies, max_bins=MAX_BINS):
+    """
+    Both passes over a re-readable source, yielding filled chunks
+    read_chunks: function returning a fresh chunk iterator each call,
+                 e.g. lambda: pd.read_csv(path, chunksize=1_000_000)
+    """
+    imputer = StreamingImputer(strategies, max_bins)
+    for chunk in read_chunks():
+        imputer.fit_chunk(chunk)
+    for chunk in read_chunks():
+        yield imputer.transform_chunk(chunk)
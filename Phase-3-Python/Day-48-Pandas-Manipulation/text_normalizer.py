@@ -0,0 +1,110 @@
+# Day 48 - Text Normalization on Unique Values
+# .str.title() once per distinct value instead of once per row, with a cache on disk
+
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+CACHE_VERSION = 2
+DEFAULT_CACHE_PATH = '.text_normalizer_cache.json'
+
+
+def _transform_name(transform):
+    """Stable cache key for a transform function: 'str.title', 'mymodule.clean', ..."""
+    qualname = getattr(transform, '__qualname__', None)
+    if qualname is None or '<' in qualname:
+        raise ValueError(f"Pass name= for transform {transform!r}: it has no stable name to key the cache by")
+    module = getattr(transform, '__module__', None)
+    return f"{module}.{qualname}" if module and module != 'builtins' else qualname
+
+
+class TextNormalizer:
+    """
+    Clean text columns through their dictionary of distinct values:
+    factorize -> transform each unique string once -> categorical column
+    The raw -> clean mapping is kept between runs in a JSON file, so values
+    seen before are never transformed again.
+    One cache file holds every transform, {name: {column: {raw: clean}}}, keyed
+    by `name`, which defaults to the transform's qualified name
+    (str.title -> 'str.title'); lambdas and local functions need an explicit name.
+    """
+
+    def __init__(self, transform=str.title, name=None, cache_path=DEFAULT_CACHE_PATH):
+        self.transform = transform
+        self.name = name or _transform_name(transform)
+        self.cache_path = cache_path
+        self.mapping = {}      # column -> {raw value: clean value}
+        self.hits = 0
+        self.misses = 0
+        self._dirty = False
+        if cache_path:
+            self._load()
+
+    def _read_cache(self):
+        """{transform name: {column: {raw: clean}}} from the cache file ({} if absent / old format)"""
+        try:
+            with open(self.cache_path) as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return cache['transforms'] if cache.get('version') == CACHE_VERSION else {}
+
+    def _load(self):
+        self.mapping = self._read_cache().get(self.name, {})
+
+    def save(self):
+        """
+        Write the mapping cache (only if something new was learned);
+        only this transform's entry changes, other transforms' mappings are kept
+        """
+        if not self.cache_path or not self._dirty:
+            return
+        transforms = self._read_cache()
+        stored = transforms.setdefault(self.name, {})
+        for column, values in self.mapping.items():
+            stored.setdefault(column, {}).update(values)
+        tmp_path = self.cache_path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump({'version': CACHE_VERSION, 'transforms': transforms},
+                      f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.cache_path)
+        self._dirty = False
+
+    def _clean_values(self, column, uniques):
+        known = self.mapping.setdefault(column, {})
+        cleaned = []
+        for value in uniques:
+            if value in known:
+                self.hits += 1
+            else:
+                known[value] = self.transform(value)
+                self.misses += 1
+                self._dirty = True
+            cleaned.append(known[value])
+        return cleaned
+
+    def normalize(self, series, column=None):
+        """
+        Same values as series.str.<transform>(), returned as a categorical
+        (categories sorted; missing and non-string values come back missing,
+        as they do from the .str accessor)
+        """
+        column = column or series.name
+        codes, uniques = pd.factorize(series)
+        is_text = np.array([isinstance(value, str) for value in uniques], dtype=bool)
+        cleaned = self._clean_values(column, list(uniques[is_text]))
+        # Several raw spellings can clean to the same value ('north', 'NORTH')
+        categories = pd.Index(sorted(set(cleaned)))
+        remap = np.full(len(uniques) + 1, -1)
+        remap[np.flatnonzero(is_text)] = categories.get_indexer(cleaned)
+        return pd.Series(pd.Categorical.from_codes(remap[codes], categories=categories),
+                         index=series.index, name=series.name)
+
+    def normalize_columns(self, df, columns):
+        """Normalize several text columns in place and persist the cache"""
+        for column in columns:
+            df[column] = self.normalize(df[column], column)
+        self.save()
+        return df
@@ -0,0 +1,143 @@
+# Day 48 - Automatic Type Inference
+# Pick the narrowest dtype for each column from a sample, convert in bulk, report memory
+
+import numpy as np
+import pandas as pd
+
+SAMPLE_SIZE = 1_000
+# Text columns with at most this share of distinct values become category
+CATEGORY_RATIO = 0.5
+BOOL_STRINGS = {'true': True, 'false': False}
+INT_TYPES = (np.int8, np.int16, np.int32, np.int64)
+
+
+def _is_text(series):
+    return pd.api.types.is_object_dtype(series) or pd.api.types.is_string_dtype(series)
+
+
+def _sample(values, size):
+    """Evenly spaced non-null sample (start, middle and end of the file all show up)"""
+    values = values.dropna()
+    if len(values) <= size:
+        return values
+    return values.iloc[np.linspace(0, len(values) - 1, size).astype(np.int64)]
+
+
+def smallest_int(values):
+    """Narrowest signed integer type that holds every value"""
+    if len(values) == 0:
+        return np.int8
+    low, high = values.min(), values.max()
+    for int_type in INT_TYPES:
+        info = np.iinfo(int_type)
+        if info.min <= low and high <= info.max:
+            return int_type
+    return np.int64
+
+
+def _numeric_dtype(values):
+    """
+    int8..int64 for whole numbers without gaps, float32 if lossless, else float64
+    Extension columns (Int64, Float64, boolean) with <NA> keep a nullable type: Int8, Float32, ...
+    """
+    nullable = isinstance(values.dtype, pd.api.extensions.ExtensionDtype) and values.isna().any()
+    if pd.api.types.is_bool_dtype(values):
+        return 'boolean' if nullable else 'bool'
+    if pd.api.types.is_integer_dtype(values):
+        name = np.dtype(smallest_int(values.dropna())).name
+        return name.capitalize() if nullable else name
+    array = values.to_numpy(dtype=np.float64, na_value=np.nan)
+    finite = array[~np.isnan(array)]
+    if len(finite) == len(array) and np.array_equal(finite, np.round(finite)) \
+            and (len(finite) == 0 or np.abs(finite).max() < 2 ** 53):
+        return np.dtype(smallest_int(finite)).name
+    # float32 only when every value survives the round trip exactly
+    name = 'float32' if np.array_equal(finite.astype(np.float32).astype(np.float64), finite) else 'float64'
+    return name.capitalize() if nullable else name
+
+
+def _infer(series, sample_size):
+    """(target dtype, column already parsed to numbers / dates or None)"""
+    if not _is_text(series):
+        if pd.api.types.is_numeric_dtype(series):
+            return _numeric_dtype(series), series
+        return series.dtype.name, series
+
+    sample = _sample(series, sample_size)
+    if len(sample) == 0:
+        return series.dtype.name, series
+    text = sample.astype(str).str.strip()
+    if text.str.lower().isin(BOOL_STRINGS.keys()).all():
+        flags = series.astype(str).str.strip().str.lower().map(BOOL_STRINGS)
+        if flags.notna().sum() == series.notna().sum():
+            return ('bool' if series.notna().all() else 'boolean'), flags
+    if pd.to_numeric(text, errors='coerce').notna().all():
+        numbers = pd.to_numeric(series, errors='coerce')
+        if numbers.notna().sum() == series.notna().sum():
+            return _numeric_dtype(numbers), numbers
+    if pd.to_datetime(text, errors='coerce', format='ISO8601').notna().all():
+        dates = pd.to_datetime(series, errors='coerce', format='ISO8601')
+        if dates.notna().sum() == series.notna().sum():
+            return dates.dtype.name, dates
+    if series.nunique() <= CATEGORY_RATIO * len(series):
+        return 'category', None
+    return series.dtype.name, series
+
+
+def infer_dtype(series, sample_size=SAMPLE_SIZE):
+    """
+    Target dtype for one column
+    Text columns: tried on a sample as bool ('True'/'False'), number, ISO date,
+    then category (few distinct values); a candidate is only accepted if the
+    whole column parses, and numbers are range-checked on the full column so
+    the downcast can never overflow
+    """
+    return _infer(series, sample_size)[0]
+
+
+def convert(series, dtype):
+    """Convert one column to an inferred dtype"""
+    if dtype == series.dtype.name:
+        return series
+    if dtype in ('bool', 'boolean') and _is_text(series):
+        return series.astype(str).str.strip().str.lower().map(BOOL_STRINGS).astype(dtype)
+    if dtype.startswith('datetime64') and _is_text(series):
+        return pd.to_datetime(series, format='ISO8601').astype(dtype)
+    if dtype == 'category':
+        return series.astype('category')
+    if _is_text(series):
+        series = pd.to_numeric(series)
+    return series.astype(dtype)
+
+
+def infer_schema(df, columns=None, sample_size=SAMPLE_SIZE):
+    """{column: narrowest dtype} for the given columns (default: all)"""
+    columns = df.columns if columns is None else columns
+    return {column: infer_dtype(df[column], sample_size) for column in columns}
+
+
+def optimize_dtypes(df, columns=None, sample_size=SAMPLE_SIZE):
+    """
+    Infer and convert in one go
+    Returns (converted copy of df, memory report with one row per column)
+    """
+    columns = df.columns if columns is None else columns
+    result = df.copy()
+    for column in columns:
+        dtype, parsed = _infer(df[column], sample_size)
+        # Numbers / dates were already parsed while inferring: only the cast is left
+        result[column] = parsed.astype(dtype) if parsed is not None else convert(df[column], dtype)
+    return result, memory_report(df, result)
+
+
+def memory_report(before, after):
+    """dtype and deep memory usage of each column before and after, plus a total row"""
+    report = pd.DataFrame({
+        'dtype_before': before.dtypes.astype(str),
+        'dtype_after': after.dtypes.astype(str),
+        'bytes_before': before.memory_usage(deep=True, index=False),
+        'bytes_after': after.memory_usage(deep=True, index=False),
+    })
+    report.loc['TOTAL'] = ['', '', report['bytes_before'].sum(), report['bytes_after'].sum()]
+    report['reduction'] = (report['bytes_before'] / report['bytes_after']).round(1)
+    return report
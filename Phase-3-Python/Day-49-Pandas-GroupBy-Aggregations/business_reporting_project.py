@@ -5,6 +5,8 @@
 import pandas as pd
 import numpy as np
 
+from report_builder import ReportBuilder
+
 print("="*70)
 print("EXECUTIVE BUSINESS ANALYTICS REPORT")
 print("Scenario: Quarterly Sales Performance Analysis")
@@ -40,11 +42,15 @@ print(f"Total Transactions: {len(df):,}")
 print(f"Date Range: {df['Date'].min().date()} to {df['Date'].max().date()}")
 print(f"Total Revenue: ₹{df['Net_Revenue'].sum():,.2f}")
 
+# Every section groups the same table by a different key: factorize the keys
+# once here and answer all the groupbys below from the cached codes
+report = ReportBuilder(df, dimensions=['Region', 'Product', 'Customer_Type', 'Month'])
+
 print("\n" + "="*70)
 print("SECTION 1: REGIONAL PERFORMANCE ANALYSIS")
 print("="*70)
 
-region_perf = df.groupby('Region').agg(
+region_perf = report.aggregate('Region',
     Total_Revenue=('Net_Revenue', 'sum'),
     Avg_Order_Value=('Net_Revenue', 'mean'),
     Total_Transactions=('Net_Revenue', 'count'),
@@ -72,7 +78,7 @@ print("\n" + "="*70)
 print("SECTION 2: PRODUCT PERFORMANCE ANALYSIS")
 print("="*70)
 
-product_perf = df.groupby('Product').agg(
+product_perf = report.aggregate('Product',
     Total_Revenue=('Net_Revenue', 'sum'),
     Total_Quantity=('Quantity', 'sum'),
     Avg_Price=('Unit_Price', 'mean'),
@@ -101,7 +107,7 @@ print("\n" + "="*70)
 print("SECTION 3: CUSTOMER SEGMENTATION ANALYSIS")
 print("="*70)
 
-customer_analysis = df.groupby('Customer_Type').agg(
+customer_analysis = report.aggregate('Customer_Type',
     Total_Revenue=('Net_Revenue', 'sum'),
     Avg_Order_Value=('Net_Revenue', 'mean'),
     Transaction_Count=('Net_Revenue', 'count'),
@@ -129,7 +135,7 @@ print("SECTION 4: TIME-BASED TRENDS")
 print("="*70)
 
 # Monthly trend
-monthly_trend = df.groupby('Month').agg(
+monthly_trend = report.aggregate('Month',
     Revenue=('Net_Revenue', 'sum'),
     Transactions=('Net_Revenue', 'count'),
     Avg_Order=('Net_Revenue', 'mean')
@@ -154,12 +160,11 @@ print("\n" + "="*70)
 print("SECTION 5: REGIONAL PRODUCT MATRIX")
 print("="*70)
 
-# Pivot table: Region × Product
-region_product_matrix = pd.pivot_table(
-    df,
-    values='Net_Revenue',
+# Pivot table: Region × Product (both keys already factorized)
+region_product_matrix = report.pivot(
     index='Region',
     columns='Product',
+    values='Net_Revenue',
     aggfunc='sum',
     fill_value=0
 ).round(0)
@@ -178,7 +183,9 @@ print("\n" + "="*70)
 print("SECTION 6: SALESPERSON PERFORMANCE")
 print("="*70)
 
-salesperson_perf = df.groupby('Salesperson').agg(
+# New dimension: only the Salesperson column is factorized, nothing else is rescanned
+report.add_dimension('Salesperson')
+salesperson_perf = report.aggregate('Salesperson',
     Total_Revenue=('Net_Revenue', 'sum'),
     Transactions=('Net_Revenue', 'count'),
     Avg_Deal_Size=('Net_Revenue', 'mean'),
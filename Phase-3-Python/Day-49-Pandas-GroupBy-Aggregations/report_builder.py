@@ -0,0 +1,154 @@
+# Day 49 - Report Builder
+# Factorize each key column once, then answer every groupby of the report from the codes
+
+import numpy as np
+import pandas as pd
+
+AGGREGATIONS = ('sum', 'mean', 'count', 'size', 'nunique', 'min', 'max')
+
+
+class ReportBuilder:
+    """
+    Many groupby().agg() reports over one table, sharing the work
+    - each dimension (key column) is factorized once and its codes cached
+    - value columns are pulled out as numpy arrays once
+    - sums / counts per (dimension, column) are cached, so 'mean' reuses them
+    add_dimension() later only scans that one new column.
+    Results match df.groupby(dim).agg(...) (sorted keys, missing keys dropped);
+    float sums can differ from pandas in the last digit (summation order).
+    """
+
+    def __init__(self, df, dimensions=()):
+        self.df = df
+        self.dimensions = {}   # column -> (codes, uniques)
+        self._values = {}      # column -> (numpy array, non-missing mask or None)
+        self._cache = {}       # (dimension, column, statistic) -> array per group
+        for column in dimensions:
+            self.add_dimension(column)
+
+    def add_dimension(self, column):
+        """Factorize one more key column (sorted, like groupby keys); no-op if known"""
+        if column not in self.dimensions:
+            codes, uniques = pd.factorize(self.df[column], sort=True)
+            self.dimensions[column] = (codes, uniques)
+        return self
+
+    def _groups(self, dimension):
+        self.add_dimension(dimension)
+        return self.dimensions[dimension]
+
+    def _array(self, column):
+        if column not in self._values:
+            values = self.df[column].to_numpy()
+            present = pd.notna(values) if values.dtype.kind in 'fmMO' else None
+            self._values[column] = (values, present)
+        return self._values[column]
+
+    def _value_codes(self, column):
+        """Factorized value column (for nunique), shared by every dimension"""
+        key = (None, column, 'codes')
+        if key not in self._cache:
+            self._cache[key] = pd.factorize(self.df[column])
+        return self._cache[key]
+
+    def _order(self, dimension):
+        """Row order that puts each group's rows together (for min / max)"""
+        key = (dimension, None, 'order')
+        if key not in self._cache:
+            self._cache[key] = np.argsort(self._groups(dimension)[0], kind='stable')
+        return self._cache[key]
+
+    def _stat(self, dimension, column, statistic):
+        key = (dimension, column, statistic)
+        if key in self._cache:
+            return self._cache[key]
+
+        codes, uniques = self._groups(dimension)
+        n_groups = len(uniques)
+        if statistic == 'size':
+            result = np.bincount(codes[codes >= 0], minlength=n_groups)
+        elif statistic == 'mean':
+            result = self._stat(dimension, column, 'sum') / self._stat(dimension, column, 'count')
+        elif statistic == 'nunique':
+            value_codes, value_uniques = self._value_codes(column)
+            valid = (codes >= 0) & (value_codes >= 0)
+            # Distinct (group, value) pairs as one int64 key each: memory grows with rows,
+            # not with groups x distinct values
+            pairs = np.unique(codes[valid].astype(np.int64) * len(value_uniques) + value_codes[valid])
+            result = np.bincount(pairs // max(len(value_uniques), 1), minlength=n_groups)
+        elif statistic in ('min', 'max'):
+            values, present = self._array(column)
+            order = self._order(dimension)
+            group = codes[order]
+            keep = group >= 0
+            if present is not None:
+                keep &= present[order]
+            group, values = group[keep], values[order[keep]]
+            result = np.full(n_groups, np.nan) if values.dtype.kind in 'iufb' else np.full(n_groups, None)
+            if len(group):
+                starts = np.flatnonzero(np.r_[True, group[1:] != group[:-1]])
+                reduce = np.minimum if statistic == 'min' else np.maximum
+                reduced = reduce.reduceat(values, starts)
+                if len(starts) == n_groups:
+                    result = reduced
+                else:
+                    result[group[starts]] = reduced
+        elif statistic in ('sum', 'count'):
+            values, present = self._array(column)
+            valid = codes >= 0
+            if present is not None:
+                valid &= present
+            group, values = codes[valid], values[valid]
+            if statistic == 'count':
+                result = np.bincount(group, minlength=n_groups)
+            else:
+                result = np.bincount(group, weights=values, minlength=n_groups)
+                if values.dtype.kind in 'iub':
+                    # Integer sums stay integers; float64 is exact while |total| < 2**53
+                    # (bound in Python ints: the int64 product could wrap)
+                    if len(values) and max(-int(values.min()), int(values.max())) * len(values) >= 2 ** 53:
+                        result = np.zeros(n_groups, dtype=np.int64)
+                        np.add.at(result, group, values.astype(np.int64))
+                    result = result.astype(np.int64)
+        else:
+            raise ValueError(f"Unsupported aggregation {statistic!r}; use one of {AGGREGATIONS}")
+        self._cache[key] = result
+        return result
+
+    def aggregate(self, dimension, **named):
+        """
+        Same as df.groupby(dimension).agg(name=(column, aggregation), ...)
+        """
+        _, uniques = self._groups(dimension)
+        data = {name: self._stat(dimension, column, statistic)
+                for name, (column, statistic) in named.items()}
+        return pd.DataFrame(data, index=pd.Index(uniques, name=dimension))
+
+    def aggregate_many(self, reports):
+        """
+        Several reports in one batch: {report name: (dimension, {name: (column, aggregation)})}
+        Shared dimensions / columns / statistics are computed once.
+        """
+        return {report: self.aggregate(dimension, **named)
+                for report, (dimension, named) in reports.items()}
+
+    def pivot(self, index, columns, values, aggfunc='sum', fill_value=0):
+        """
+        Two-dimension table from the cached codes, like
+        pd.pivot_table(df, values=values, index=index, columns=columns, aggfunc='sum', fill_value=...)
+        """
+        if aggfunc != 'sum':
+            raise ValueError("pivot() supports aggfunc='sum'")
+        row_codes, row_uniques = self._groups(index)
+        col_codes, col_uniques = self._groups(columns)
+        data, present = self._array(values)
+        valid = (row_codes >= 0) & (col_codes >= 0)
+        if present is not None:
+            valid &= present
+        cells = row_codes[valid] * len(col_uniques) + col_codes[valid]
+        size = len(row_uniques) * len(col_uniques)
+        totals = np.bincount(cells, weights=data[valid], minlength=size)
+        present = np.bincount(cells, minlength=size) > 0
+        table = np.where(present, totals, fill_value).reshape(len(row_uniques), len(col_uniques))
+        return pd.DataFrame(table, index=pd.Index(row_uniques, name=index),
+                            columns=pd.Index(col_uniques, name=columns))